@@ -1,6 +1,9 @@
 from django.contrib import admin
-from .models import Event, Nominee, Feedback
+from .models import Employee, Event, Nominee, Feedback, OutboxEmail, ImportJob
 
+admin.site.register(Employee)
 admin.site.register(Event)
 admin.site.register(Nominee)
 admin.site.register(Feedback)
+admin.site.register(OutboxEmail)
+admin.site.register(ImportJob)
@@ -0,0 +1,166 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, F, Max, Q, Sum
+
+from .filters import filter_events
+from .models import Event, Nominee
+
+RATINGS = range(1, 6)
+
+HITS_KEY = "feedback-analytics:hits"
+MISSES_KEY = "feedback-analytics:misses"
+
+
+def _count(key):
+    cache.add(key, 0, timeout=None)
+    cache.incr(key)
+
+
+def _rate(part, whole):
+    return round(part / whole, 4) if whole else None
+
+
+def _breakdown(attended, responses, rating_sum, distribution):
+    return {
+        "attended": attended,
+        "responses": responses,
+        "response_rate": _rate(responses, attended),
+        "average_rating": round(rating_sum / responses, 2) if responses else None,
+        "rating_distribution": distribution,
+    }
+
+
+def build_event_analytics(event):
+    """Rating stats for one event, overall and per department.
+
+    One grouped query over the event's nominees (JOIN employee, LEFT JOIN
+    feedback) returns per-department counts; the event totals are their
+    sums.
+    """
+    rows = (
+        Nominee.objects.filter(event=event)
+        .values(department=F("employee__department"))
+        .annotate(
+            attended=Count("id", filter=Q(status="Attended")),
+            responses=Count("feedback"),
+            rating_sum=Sum("feedback__rating", default=0),
+            **{
+                f"rating_{rating}": Count(
+                    "feedback", filter=Q(feedback__rating=rating)
+                )
+                for rating in RATINGS
+            },
+        )
+        .order_by("department")
+    )
+
+    totals = dict.fromkeys(["attended", "responses", "rating_sum"], 0)
+    distribution = dict.fromkeys(map(str, RATINGS), 0)
+    departments = []
+    for row in rows:
+        if not (row["attended"] or row["responses"]):
+            continue
+        row_distribution = {
+            str(rating): row[f"rating_{rating}"] for rating in RATINGS
+        }
+        for key in totals:
+            totals[key] += row[key]
+        for rating, count in row_distribution.items():
+            distribution[rating] += count
+        departments.append(
+            {
+                "department": row["department"],
+                **_breakdown(
+                    row["attended"],
+                    row["responses"],
+                    row["rating_sum"],
+                    row_distribution,
+                ),
+            }
+        )
+
+    return {
+        "event": {"id": event.id, "title": event.title, "date": event.date},
+        **_breakdown(
+            totals["attended"], totals["responses"], totals["rating_sum"], distribution
+        ),
+        "departments": departments,
+    }
+
+
+def get_event_analytics(event):
+    """Event analytics, cached per event.
+
+    The key includes ``updated_at``, which every nominee and feedback change
+    bumps, so a new submission is reflected on the next request.
+    """
+    key = f"feedback-analytics:{event.id}:{event.updated_at.isoformat()}"
+    analytics = cache.get(key)
+    if analytics is None:
+        _count(MISSES_KEY)
+        analytics = build_event_analytics(event)
+        cache.set(key, analytics, timeout=settings.FEEDBACK_ANALYTICS_TTL)
+    else:
+        _count(HITS_KEY)
+    return analytics
+
+
+def cache_counters():
+    """Hit/miss counts of the per-event analytics cache."""
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": _rate(hits, lookups),
+    }
+
+
+def build_trend(events):
+    """Response rate and average rating per event, oldest first."""
+    rows = (
+        events.order_by()
+        .annotate(average_rating=Avg("nominees__feedback__rating"))
+        .order_by("date", "time")
+        .values(
+            "id",
+            "title",
+            "date",
+            "attended_count",
+            "feedback_count",
+            "average_rating",
+        )
+    )
+    trend = []
+    for row in rows:
+        average = row["average_rating"]
+        trend.append(
+            {
+                "event_id": row["id"],
+                "title": row["title"],
+                "date": row["date"],
+                "attended": row["attended_count"],
+                "responses": row["feedback_count"],
+                "response_rate": _rate(row["feedback_count"], row["attended_count"]),
+                "average_rating": None if average is None else round(average, 2),
+            }
+        )
+    return trend
+
+
+def get_trend(params):
+    """The feedback trend across events matching ``date_from`` / ``date_to``."""
+    events = filter_events(Event.objects.all(), params)
+    version = events.order_by().aggregate(last=Max("updated_at"), count=Count("id"))
+    key = "feedback-trend:{}:{}:{}:{}".format(
+        params.get("date_from", ""),
+        params.get("date_to", ""),
+        version["last"] and version["last"].isoformat(),
+        version["count"],
+    )
+    trend = cache.get(key)
+    if trend is None:
+        trend = build_trend(events)
+        cache.set(key, trend, timeout=settings.FEEDBACK_ANALYTICS_TTL)
+    return trend
@@ -0,0 +1,149 @@
+"""Async versions of the public endpoints, for ASGI deployments.
+
+Enabled with ``ASYNC_PUBLIC_VIEWS = True`` and served by
+``config.asgi:application`` (e.g. under uvicorn). Lookups use the async
+ORM; the transactional writes run as one ``sync_to_async`` call each.
+Emails only go into the outbox, so no request waits on SMTP.
+"""
+
+import json
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from rest_framework import status
+
+from .models import Nominee
+from .views import (
+    RESPONSE_FIELDS,
+    _apply_response,
+    _nominee_info,
+    _response_redirect,
+    _save_feedback,
+)
+
+
+def public_view(*methods):
+    """Async counterpart of ``@api_view(methods)`` with ``AllowAny``.
+
+    Django 4.2's method and CSRF decorators cannot wrap coroutines, so the
+    method check and CSRF exemption (DRF exempts anonymous requests too)
+    are done here.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in methods:
+                return JsonResponse(
+                    {"detail": f'Method "{request.method}" not allowed.'},
+                    status=status.HTTP_405_METHOD_NOT_ALLOWED,
+                )
+            return await view(request, *args, **kwargs)
+
+        wrapper.csrf_exempt = True
+        return wrapper
+
+    return decorator
+
+
+def _request_data(request):
+    """Parse a JSON or form body the way DRF's default parsers would."""
+    if request.content_type == "application/json":
+        return json.loads(request.body or b"{}")
+    return request.POST.copy()
+
+
+def _not_found():
+    return JsonResponse(
+        {"error": "Nominee not found."}, status=status.HTTP_404_NOT_FOUND
+    )
+
+
+# ─── Accept / Reject (Public links) ──────────────────────────────────
+
+
+async def _respond_to_invitation(pk, new_status):
+    try:
+        nominee = await (
+            Nominee.objects.live()
+            .select_related("event", "employee")
+            .only(*RESPONSE_FIELDS)
+            .aget(pk=pk)
+        )
+    except Nominee.DoesNotExist:
+        return _not_found()
+
+    changed = nominee.status == "Pending" and await sync_to_async(_apply_response)(
+        nominee, new_status
+    )
+    return _response_redirect(nominee, new_status, changed)
+
+
+@public_view("GET")
+async def nominee_accept(request, pk):
+    """Nominee accepts the invitation (public link from email)."""
+    return await _respond_to_invitation(pk, "Accepted")
+
+
+@public_view("GET")
+async def nominee_reject(request, pk):
+    """Nominee rejects the invitation (public link from email)."""
+    return await _respond_to_invitation(pk, "Rejected")
+
+
+# ─── Feedback ─────────────────────────────────────────────────────────
+
+
+@public_view("POST")
+async def submit_feedback(request, nominee_id):
+    """Submit feedback (public page, no auth required)."""
+    try:
+        nominee = await (
+            Nominee.objects.live().select_related("feedback").aget(pk=nominee_id)
+        )
+    except Nominee.DoesNotExist:
+        return _not_found()
+
+    if nominee.status != "Attended":
+        return JsonResponse(
+            {"error": "Feedback can only be submitted by attended nominees."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        data = _request_data(request)
+    except ValueError as exc:
+        return JsonResponse(
+            {"detail": f"JSON parse error - {exc}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if not isinstance(data, dict):
+        return JsonResponse(
+            {"non_field_errors": ["Invalid data. Expected a dictionary."]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    data, response_status = await sync_to_async(_save_feedback)(nominee, data)
+    return JsonResponse(data, status=response_status)
+
+
+@public_view("GET")
+async def get_nominee_info(request, nominee_id):
+    """Get nominee and event info for the feedback form (public)."""
+    try:
+        nominee = await (
+            Nominee.objects.live()
+            .select_related("event", "employee", "feedback")
+            .aget(pk=nominee_id)
+        )
+    except Nominee.DoesNotExist:
+        return _not_found()
+
+    if nominee.status != "Attended":
+        return JsonResponse(
+            {"error": "Feedback is only available for attended nominees."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return JsonResponse(_nominee_info(nominee))
@@ -0,0 +1,95 @@
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from .imports import CHUNK_SIZE, _chunks, _header, read_csv
+from .live import publish_status_change
+from .models import Nominee
+
+# Accepted request keys and the Nominee column each one is matched on
+ID_FIELDS = {"nominee_ids": "id", "employee_ids": "employee_id"}
+
+
+def _normalize(field, values):
+    """Strip, type-check and de-duplicate scanned IDs, keeping their order.
+
+    Returns ``(keys, invalid)``: the lookup keys and the rejected raw values.
+    """
+    keys, invalid = {}, []
+    for value in values:
+        key = str(value).strip()
+        if field == "id":
+            key = int(key) if key.isdigit() else None
+        if key:
+            keys.setdefault(key, None)
+        else:
+            invalid.append(value)
+    return list(keys), invalid
+
+
+def ids_from_csv(fileobj, column):
+    """Read one column of a badge-scanner CSV export.
+
+    ``column`` is matched like import headings, so "Employee ID" finds
+    ``employee_id``. Returns ``(field, values)``, ``field`` being the
+    Nominee column the values are matched on.
+    """
+    column = _header(column)
+    headers, rows = read_csv(fileobj)
+    if column not in headers:
+        raise ValidationError({"column": f"The CSV has no '{column}' column."})
+    field = "id" if column in ("id", "nominee_id") else "employee_id"
+    return field, [row.get(column, "") for row in rows]
+
+
+def mark_attended(event_id, field, values):
+    """Move the given ``Accepted`` nominees of an event to ``Attended``.
+
+    ``field`` is ``"id"`` or ``"employee_id"``. The matching rows are
+    locked, then every eligible one changes in a single conditional
+    UPDATE. Returns ``(attended, skipped)``: the keys that were marked and
+    one ``{"id", "reason"}`` entry (plus ``status`` where known) per key
+    that was not.
+    """
+    keys, invalid = _normalize(field, values)
+    skipped = [{"id": value, "reason": "invalid"} for value in invalid]
+
+    with transaction.atomic():
+        statuses = {}
+        for chunk in _chunks(keys, CHUNK_SIZE):
+            rows = (
+                Nominee.objects.select_for_update()
+                .filter(event_id=event_id, **{f"{field}__in": chunk})
+                .order_by()
+                .values_list(field, "id", "status")
+            )
+            for key, pk, nominee_status in rows:
+                statuses.setdefault(key, []).append((pk, nominee_status))
+
+        eligible = [
+            pk
+            for matches in statuses.values()
+            for pk, nominee_status in matches
+            if nominee_status == "Accepted"
+        ]
+        for chunk in _chunks(eligible, CHUNK_SIZE):
+            Nominee.objects.filter(id__in=chunk).transition(
+                event_id, "Accepted", "Attended"
+            )
+            publish_status_change(event_id, chunk, "Accepted", "Attended")
+
+    attended = []
+    for key in keys:
+        matches = statuses.get(key)
+        if not matches:
+            skipped.append({"id": key, "reason": "not_found"})
+        elif any(nominee_status == "Accepted" for _, nominee_status in matches):
+            attended.append(key)
+        elif any(nominee_status == "Attended" for _, nominee_status in matches):
+            skipped.append(
+                {"id": key, "reason": "already_attended", "status": "Attended"}
+            )
+        else:
+            skipped.append(
+                {"id": key, "reason": "not_accepted", "status": matches[0][1]}
+            )
+    return attended, skipped
@@ -0,0 +1,60 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.views.decorators.http import condition
+from rest_framework.exceptions import ValidationError
+
+from .filters import filter_events
+from .models import Event
+
+
+def conditional_get(version_func):
+    """ETag support for an authenticated read endpoint.
+
+    ``version_func(request, *args, **kwargs)`` returns ``(updated_at,
+    extra)`` describing the resource cheaply, or ``None`` if it does not
+    exist. It runs at most once per request and only for authenticated
+    GET/HEAD; a matching ``If-None-Match`` then returns 304 before the view
+    runs. The ETag also covers the full URL so filters, pages and
+    ``fields=`` get distinct tags.
+
+    No ``Last-Modified`` is sent: HTTP dates have one-second resolution,
+    so a second change within the same second would still match
+    ``If-Modified-Since`` and serve a stale 304.
+    """
+
+    def version(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD") or not request.user.is_authenticated:
+            return None
+        if not hasattr(request, "_resource_version"):
+            request._resource_version = version_func(request, *args, **kwargs)
+        return request._resource_version
+
+    def etag(request, *args, **kwargs):
+        current = version(request, *args, **kwargs)
+        if current is None:
+            return None
+        key = repr((request.get_full_path(), current)).encode()
+        return hashlib.md5(key, usedforsecurity=False).hexdigest()
+
+    return condition(etag_func=etag)
+
+
+def event_list_version(request):
+    """Newest ``updated_at`` plus row count, so deletions change the ETag."""
+    try:
+        events = filter_events(Event.objects.order_by(), request.GET)
+    except ValidationError:
+        return None  # let the view report the bad filter
+    version = events.aggregate(last=Max("updated_at"), count=Count("id"))
+    return version["last"], version["count"]
+
+
+def event_version(request, pk=None, event_id=None):
+    """An event's ``updated_at``, bumped by every nominee/feedback change."""
+    updated_at = (
+        Event.objects.filter(pk=pk or event_id)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+    return None if updated_at is None else (updated_at, None)
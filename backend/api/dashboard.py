@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from .models import Event, Nominee
+
+CACHE_KEY = "dashboard-summary"
+UPCOMING_LIMIT = 5
+RECENT_RESPONSES_LIMIT = 10
+
+
+def build_summary():
+    """Everything the dashboard shows, from four queries over Event/Nominee."""
+    counters = Event.COUNTER_FIELDS
+    events = list(
+        Event.objects.order_by("-created_at").values(
+            "id", "title", "date", "time", "venue", *counters
+        )
+    )
+    totals = Event.objects.aggregate(
+        events=Count("id"), **{field: Sum(field) for field in counters}
+    )
+    totals = {field: value or 0 for field, value in totals.items()}
+    upcoming = list(
+        Event.objects.filter(date__gte=timezone.localdate())
+        .order_by("date", "time")
+        .values("id", "title", "date", "time", "venue")[:UPCOMING_LIMIT]
+    )
+    recent_responses = list(
+        Nominee.objects.filter(
+            status_changed_at__isnull=False, event__deleted_at__isnull=True
+        )
+        .order_by("-status_changed_at")
+        .values(
+            "id",
+            "status",
+            "status_changed_at",
+            "event_id",
+            name=F("employee__name"),
+            department=F("employee__department"),
+            event_title=F("event__title"),
+        )[:RECENT_RESPONSES_LIMIT]
+    )
+    return {
+        "totals": totals,
+        "events": events,
+        "upcoming": upcoming,
+        "recent_responses": recent_responses,
+    }
+
+
+def get_summary():
+    """The dashboard summary, cached for ``DASHBOARD_SUMMARY_TTL`` seconds."""
+    summary = cache.get(CACHE_KEY)
+    if summary is None:
+        summary = build_summary()
+        cache.set(CACHE_KEY, summary, timeout=settings.DASHBOARD_SUMMARY_TTL)
+    return summary
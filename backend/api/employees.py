@@ -0,0 +1,83 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, F, Q
+
+from .models import Employee, Nominee
+
+# Nominations to events waiting for the purge worker do not count.
+LIVE_NOMINATION = Q(nominations__event__deleted_at__isnull=True)
+
+
+def employee_history(employee):
+    """Every nomination of ``employee``, newest event first.
+
+    A lookup on the nominee ``employee_id`` index plus primary-key joins to
+    the event and feedback; no other nominee rows are read.
+    """
+    nominations = list(
+        Nominee.objects.filter(employee=employee, event__deleted_at__isnull=True)
+        .order_by("-event__date", "-event__time", "-id")
+        .values(
+            "event_id",
+            "status",
+            "status_changed_at",
+            nominee_id=F("id"),
+            event_title=F("event__title"),
+            event_date=F("event__date"),
+            rating=F("feedback__rating"),
+        )
+    )
+    return {
+        "employee_id": employee.employee_id,
+        "name": employee.name,
+        "email": employee.email,
+        "department": employee.department,
+        "attended_count": sum(row["status"] == "Attended" for row in nominations),
+        "nominations": nominations,
+    }
+
+
+def build_department_rollups(department=None):
+    """Nomination counts and feedback per directory department.
+
+    Grouped on ``Employee.department``, so one department is an index
+    lookup on the directory followed by the nominee ``employee_id`` index.
+    """
+    employees = Employee.objects.order_by("department")
+    if department:
+        employees = employees.filter(department=department)
+    rows = employees.values("department").annotate(
+        employees=Count("employee_id", distinct=True),
+        total_nominations=Count("nominations", filter=LIVE_NOMINATION),
+        **{
+            field: Count(
+                "nominations", filter=LIVE_NOMINATION & Q(nominations__status=status)
+            )
+            for status, field in Nominee.COUNT_FIELDS.items()
+        },
+        feedback_count=Count("nominations__feedback", filter=LIVE_NOMINATION),
+        average_rating=Avg("nominations__feedback__rating", filter=LIVE_NOMINATION),
+    )
+    return [
+        {
+            **row,
+            "average_rating": (
+                None if row["average_rating"] is None else round(row["average_rating"], 2)
+            ),
+        }
+        for row in rows
+    ]
+
+
+def get_department_rollups(department=None):
+    """Department rollups, cached for ``DEPARTMENT_ROLLUP_TTL`` seconds."""
+    # Hashed: department names may hold characters cache keys must not.
+    digest = hashlib.md5((department or "").encode(), usedforsecurity=False)
+    key = f"department-rollups:{digest.hexdigest()}"
+    rollups = cache.get(key)
+    if rollups is None:
+        rollups = build_department_rollups(department)
+        cache.set(key, rollups, timeout=settings.DEPARTMENT_ROLLUP_TTL)
+    return rollups
@@ -0,0 +1,69 @@
+import csv
+
+from django.utils.text import compress_sequence
+
+from .models import Feedback
+
+FEEDBACK_CSV_HEADER = [
+    "Nominee Name",
+    "Email",
+    "Department",
+    "Rating",
+    "Comments",
+    "Suggestions",
+    "Submitted At",
+]
+FEEDBACK_CSV_COLUMNS = [
+    "nominee__employee__name",
+    "nominee__employee__email",
+    "nominee__employee__department",
+    "rating",
+    "comments",
+    "suggestions",
+    "submitted_at",
+]
+ROWS_PER_CHUNK = 500
+
+
+class _Echo:
+    """File-like object whose ``write`` hands the CSV line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def feedback_csv(event=None, chunk_size=ROWS_PER_CHUNK):
+    """Yield feedback CSV text a few hundred rows at a time.
+
+    Reads a ``values_list`` projection with ``iterator()`` so rows are never
+    cached as model instances. Without an ``event`` every event's feedback
+    is exported with an extra leading "Event" column.
+    """
+    header, columns = FEEDBACK_CSV_HEADER, FEEDBACK_CSV_COLUMNS
+    feedbacks = Feedback.objects.order_by("id")
+    if event is None:
+        header = ["Event"] + header
+        columns = ["nominee__event__title"] + columns
+        feedbacks = feedbacks.filter(nominee__event__deleted_at__isnull=True).order_by(
+            "nominee__event_id", "id"
+        )
+    else:
+        feedbacks = feedbacks.filter(nominee__event=event)
+
+    writer = csv.writer(_Echo())
+    buffer = [writer.writerow(header)]
+    for row in feedbacks.values_list(*columns).iterator(chunk_size=2000):
+        row = list(row)
+        # "YYYY-MM-DD HH:MM:SS" without a strftime call per row
+        row[-1] = row[-1].isoformat(" ", "seconds")[:19]
+        buffer.append(writer.writerow(row))
+        if len(buffer) >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+
+def gzip_csv(chunks):
+    """Compress CSV text chunks on the fly."""
+    return compress_sequence(chunk.encode("utf-8") for chunk in chunks)
@@ -0,0 +1,123 @@
+"""Fast JSON read path for large nominee and feedback lists.
+
+Fetches ``values_list()`` tuples and shapes them with precomputed column
+mappings instead of running DRF's per-field serializers, then encodes with
+orjson when it is installed (stdlib ``json`` otherwise). The bytes match
+what ``NomineeSerializer`` / ``FeedbackSerializer`` and DRF's
+``JSONRenderer`` produce for the same rows.
+"""
+
+import json
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import timezone
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+# Serializer field -> values() column, in NomineeSerializer field order.
+# "feedback" is nested and always last.
+NOMINEE_COLUMNS = {
+    "id": "id",
+    "event": "event_id",
+    "name": "employee__name",
+    "email": "employee__email",
+    "employee_id": "employee_id",
+    "department": "employee__department",
+    "status": "status",
+}
+NOMINEE_FEEDBACK_COLUMNS = [
+    "feedback__id",
+    "feedback__nominee_id",
+    "feedback__rating",
+    "feedback__comments",
+    "feedback__suggestions",
+    "feedback__submitted_at",
+]
+FEEDBACK_KEYS = ("id", "nominee", "rating", "comments", "suggestions", "submitted_at")
+
+# event_feedback output: the feedback fields plus the nominee's details.
+EVENT_FEEDBACK_COLUMNS = {
+    "id": "id",
+    "nominee": "nominee_id",
+    "rating": "rating",
+    "comments": "comments",
+    "suggestions": "suggestions",
+    "submitted_at": "submitted_at",
+    "nominee_name": "nominee__employee__name",
+    "nominee_email": "nominee__employee__email",
+    "nominee_department": "nominee__employee__department",
+}
+SUBMITTED_AT = list(EVENT_FEEDBACK_COLUMNS).index("submitted_at")
+
+
+def _datetime(value):
+    """Format like DRF's ``DateTimeField``: current time zone, ``Z`` for UTC."""
+    if value is None:
+        return None
+    if settings.USE_TZ and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def nominee_list(queryset, fields=None):
+    """``NomineeSerializer(queryset, many=True, fields=fields).data`` as dicts."""
+    keys = [key for key in [*NOMINEE_COLUMNS, "feedback"] if not fields or key in fields]
+    with_feedback = keys and keys[-1] == "feedback"
+    flat = keys[:-1] if with_feedback else keys
+    columns = [NOMINEE_COLUMNS[key] for key in flat]
+    if with_feedback:
+        columns += NOMINEE_FEEDBACK_COLUMNS
+    if not columns:
+        return [{} for _ in range(queryset.count())]
+
+    rows = queryset.values_list(*columns)
+    if not with_feedback:
+        return [dict(zip(flat, row)) for row in rows]
+
+    size = len(flat)
+    result = []
+    for row in rows:
+        item = dict(zip(flat, row))
+        feedback = row[size:]
+        if feedback[0] is None:
+            item["feedback"] = None
+        else:
+            item["feedback"] = dict(
+                zip(FEEDBACK_KEYS, (*feedback[:5], _datetime(feedback[5])))
+            )
+        result.append(item)
+    return result
+
+
+def event_feedback_list(queryset):
+    """The ``event_feedback`` payload: feedback rows with nominee details."""
+    keys = list(EVENT_FEEDBACK_COLUMNS)
+    result = []
+    for row in queryset.values_list(*EVENT_FEEDBACK_COLUMNS.values()):
+        row = list(row)
+        row[SUBMITTED_AT] = _datetime(row[SUBMITTED_AT])
+        result.append(dict(zip(keys, row)))
+    return result
+
+
+def dumps(data):
+    """Encode like DRF's compact ``JSONRenderer``, using orjson if available."""
+    if orjson is not None:
+        content = orjson.dumps(data)
+    else:
+        content = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+    # DRF escapes these two so the output is also valid JavaScript.
+    return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+        b"\xe2\x80\xa9", b"\\u2029"
+    )
+
+
+class FastJSONResponse(HttpResponse):
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(dumps(data), **kwargs)
@@ -0,0 +1,34 @@
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+
+def _date_param(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    parsed = parse_date(value)
+    if parsed is None:
+        raise ValidationError({name: "Expected a date in YYYY-MM-DD format."})
+    return parsed
+
+
+def filter_events(queryset, params):
+    """Apply ``date_from`` / ``date_to`` query params to an Event queryset."""
+    date_from = _date_param(params, "date_from")
+    date_to = _date_param(params, "date_to")
+    if date_from:
+        queryset = queryset.filter(date__gte=date_from)
+    if date_to:
+        queryset = queryset.filter(date__lte=date_to)
+    return queryset
+
+
+def filter_nominees(queryset, params):
+    """Apply ``status`` / ``department`` query params to a Nominee queryset."""
+    nominee_status = params.get("status")
+    department = params.get("department")
+    if nominee_status:
+        queryset = queryset.filter(status=nominee_status)
+    if department:
+        queryset = queryset.filter(employee__department=department)
+    return queryset
@@ -0,0 +1,293 @@
+import csv
+import io
+from copy import copy
+from datetime import timedelta
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .models import Employee, Event, ImportJob, Nominee
+from .outbox import enqueue
+from .serializers import NomineeImportSerializer
+from .utils import InvitationCampaign
+
+CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+# A running job whose worker saved no progress for this long is reclaimed.
+LEASE = timedelta(minutes=10)
+# Saved by the worker after every chunk.
+PROGRESS_FIELDS = [
+    "heartbeat_at",
+    "processed_rows",
+    "created_count",
+    "duplicate_count",
+    "invalid_count",
+    "errors",
+]
+SPREADSHEET_EXTENSIONS = (".csv", ".xlsx")
+
+
+def _existing_keys(event, employee_ids, emails):
+    """Return which of the given keys are already nominated to ``event``.
+
+    Emails are the nominated employees' directory emails, compared
+    lower-cased on both sides.
+    """
+    existing = (
+        Nominee.objects.filter(event=event)
+        .annotate(email_lower=Lower("employee__email"))
+        .filter(
+            Q(employee_id__in=employee_ids)
+            | Q(email_lower__in={email.lower() for email in emails})
+        )
+    )
+    taken_ids, taken_emails = set(), set()
+    for employee_id, email in existing.values_list("employee_id", "email_lower"):
+        taken_ids.add(employee_id)
+        taken_emails.add(email)
+    return taken_ids, taken_emails
+
+
+def _chunks(rows, size):
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def import_nominees(
+    event, rows, chunk_size=CHUNK_SIZE, send_invitations=True, first_row=1
+):
+    """Validate, dedupe and insert nominee rows in fixed-size chunks.
+
+    ``rows`` may be any iterable of dicts, including a generator, and is
+    consumed one chunk at a time so memory stays flat. Rows whose employee
+    id or email already exists for the event, or appeared earlier in the
+    import, are skipped; rows for an employee already in the directory
+    whose details differ from their entry are reported as invalid.
+
+    Yields the list of per-row report entries for each chunk once it has
+    been inserted, numbering rows from ``first_row``. Callers own the
+    transaction.
+    """
+    validator = NomineeImportSerializer()
+    invitations = InvitationCampaign(event) if send_invitations else None
+    row_number = first_row - 1
+
+    for chunk in _chunks(rows, chunk_size):
+        results = []
+        valid = []
+        for data in chunk:
+            row_number += 1
+            try:
+                values = validator.run_validation(data)
+            except ValidationError as e:
+                results.append(
+                    {"row": row_number, "status": "invalid", "errors": e.detail}
+                )
+                continue
+            result = {"row": row_number}
+            results.append(result)
+            valid.append((result, values))
+
+        # Earlier chunks are already inserted, so one lookup per chunk also
+        # catches duplicates across chunks without holding every key in memory.
+        employee_ids, emails = _existing_keys(
+            event,
+            [values["employee_id"] for _, values in valid],
+            [values["employee"]["email"] for _, values in valid],
+        )
+        to_create = []
+        for result, values in valid:
+            email = values["employee"]["email"].lower()
+            if values["employee_id"] in employee_ids or email in emails:
+                result["status"] = "duplicate"
+                continue
+            employee_ids.add(values["employee_id"])
+            emails.add(email)
+            to_create.append((result, values))
+
+        Employee.objects.add_missing(
+            [validator.employee(values) for _, values in to_create]
+        )
+        employees = Employee.objects.in_bulk(
+            [values["employee_id"] for _, values in to_create]
+        )
+        created = []
+        for result, values in to_create:
+            employee = employees[values["employee_id"]]
+            # People already in the directory must match their entry.
+            errors = validator.directory_errors(employee, values["employee"])
+            if errors:
+                result.update(status="invalid", errors=errors)
+                continue
+            result["status"] = "created"
+            created.append((result, Nominee(event=event, employee=employee)))
+
+        if created:
+            nominees = [nominee for _, nominee in created]
+            Nominee.objects.bulk_create(nominees)
+            Event.objects.filter(pk=event.id).adjust_counts(
+                total_nominees=len(nominees), pending_count=len(nominees)
+            )
+
+            # MySQL does not return ids from bulk_create, so look them up.
+            ids = dict(
+                Nominee.objects.filter(
+                    event=event,
+                    employee_id__in=[nominee.employee_id for nominee in nominees],
+                ).values_list("employee_id", "id")
+            )
+            for result, nominee in created:
+                nominee.id = result["id"] = ids[nominee.employee_id]
+
+            if send_invitations:
+                enqueue(*(invitations.message(nominee) for nominee in nominees))
+
+        yield results
+
+
+def summarize(results):
+    """Count report entries by status."""
+    summary = {"created": 0, "duplicate": 0, "invalid": 0}
+    for result in results:
+        summary[result["status"]] += 1
+    return summary
+
+
+def _header(value):
+    """Map a spreadsheet heading like "Employee ID" to ``employee_id``."""
+    return str(value or "").strip().lower().replace(" ", "_")
+
+
+def read_csv(fileobj):
+    """Return a CSV's normalized headings and an iterator of its data rows.
+
+    Rows are dicts keyed by heading, read from the file incrementally.
+    """
+    reader = csv.reader(io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline=""))
+    headers = [_header(value) for value in next(reader, [])]
+    rows = (dict(zip(headers, values)) for values in reader if any(values))
+    return headers, rows
+
+
+def iter_csv_rows(fileobj):
+    """Yield one dict per CSV data row, reading the file incrementally."""
+    yield from read_csv(fileobj)[1]
+
+
+def iter_xlsx_rows(fileobj):
+    """Yield one dict per row of the first worksheet (needs openpyxl)."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = [_header(value) for value in next(rows, ())]
+        for values in rows:
+            if any(value is not None for value in values):
+                yield {
+                    header: "" if value is None else str(value)
+                    for header, value in zip(headers, values)
+                }
+    finally:
+        workbook.close()
+
+
+def iter_spreadsheet_rows(fileobj, name):
+    if name.lower().endswith(".xlsx"):
+        return iter_xlsx_rows(fileobj)
+    return iter_csv_rows(fileobj)
+
+
+def _renew_lease(job):
+    """Push ``job.heartbeat_at`` forward; ``False`` if another worker took the job.
+
+    The UPDATE also locks the job row until the caller's transaction ends,
+    so the job cannot be reclaimed while a chunk is being written.
+    """
+    now = timezone.now()
+    renewed = ImportJob.objects.filter(
+        pk=job.pk, status="Running", heartbeat_at=job.heartbeat_at
+    ).update(heartbeat_at=now)
+    job.heartbeat_at = now
+    return bool(renewed)
+
+
+def _progress(job):
+    """The job's lease and progress fields, copied."""
+    return {field: copy(getattr(job, field)) for field in PROGRESS_FIELDS}
+
+
+def run_import_job(job):
+    """Stream ``job.file`` into the event, saving progress after every chunk.
+
+    Each chunk commits on its own so pollers see progress; a failure part
+    way through keeps the chunks already imported. A reclaimed job skips
+    the ``processed_rows`` committed before its previous worker stopped.
+    The upload is deleted once the job has finished.
+    """
+    committed = _progress(job)
+    try:
+        with job.file.open("rb") as fileobj:
+            rows = islice(
+                iter_spreadsheet_rows(fileobj, job.file.name), job.processed_rows, None
+            )
+            chunks = import_nominees(job.event, rows, first_row=job.processed_rows + 1)
+            while True:
+                with transaction.atomic():
+                    if not _renew_lease(job):
+                        return
+                    results = next(chunks, None)
+                    if results is None:
+                        break
+                    summary = summarize(results)
+                    job.processed_rows += len(results)
+                    job.created_count += summary["created"]
+                    job.duplicate_count += summary["duplicate"]
+                    job.invalid_count += summary["invalid"]
+                    room = MAX_REPORTED_ERRORS - len(job.errors)
+                    job.errors += [r for r in results if r["status"] != "created"][:room]
+                    job.save()
+                committed = _progress(job)
+    except Exception as e:
+        # The failed chunk's transaction rolled back its lease renewal and
+        # progress, so go back to what was committed before it.
+        for field, value in committed.items():
+            setattr(job, field, value)
+        job.status = "Failed"
+        job.error = str(e) or e.__class__.__name__
+    else:
+        job.status = "Completed"
+    job.finished_at = timezone.now()
+    with transaction.atomic():
+        if not _renew_lease(job):
+            return
+        job.save()
+    job.file.delete()
+
+
+def claim_pending_job():
+    """Mark the oldest waiting import as running and return it, or ``None``.
+
+    Running jobs whose heartbeat is older than ``LEASE`` count as waiting:
+    their worker died, and the job resumes after its last saved chunk.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        job = (
+            ImportJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status="Pending") | Q(status="Running", heartbeat_at__lt=now - LEASE)
+            )
+            .order_by("created_at")
+            .first()
+        )
+        if job is not None:
+            job.status = "Running"
+            job.heartbeat_at = now
+            job.save(update_fields=["status", "heartbeat_at"])
+    return job
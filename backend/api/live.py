@@ -0,0 +1,253 @@
+"""Live nominee updates pushed to admin screens as Server-Sent Events.
+
+Writers call ``publish_status_change`` / ``publish_feedback``; once the
+transaction commits, a pre-formatted SSE frame goes to the broker on the
+event's own channel and on the all-events channel. ``event_stream``
+relays a channel to the browser (``EventSource``) and needs the ASGI
+server (``config.asgi``): under WSGI a never-ending response would tie
+up a worker thread.
+
+``LIVE_UPDATES_BROKER`` picks the broker. ``InProcessBroker`` only
+reaches streams served by the same process; ``RedisBroker`` fans out
+through Redis (or any server speaking its pub/sub protocol) so every
+worker, and the management commands, reach every stream.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.module_loading import import_string
+from rest_framework import status
+
+from .models import Event
+
+ALL_EVENTS = "events"
+QUEUE_SIZE = 100  # frames buffered per stream before it is told to resync
+RETRY_MS = 3000  # how long EventSource waits before reconnecting
+
+KEEPALIVE = ": keep-alive\n\n"
+# Sent when frames were dropped; the client should refetch its lists.
+RESYNC = "event: resync\ndata: {}\n\n"
+
+
+def event_channel(event_id):
+    return f"event:{event_id}"
+
+
+def _frame(kind, data):
+    return f"event: {kind}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+# ─── Brokers ─────────────────────────────────────────────────────────
+
+
+class _LocalSubscription:
+    def __init__(self, broker, channel):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(QUEUE_SIZE)
+
+    def deliver(self, message):
+        """Hand ``message`` over to the stream's event loop; any thread."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:  # loop closed; the stream is gone
+            pass
+
+    def _put(self, message):
+        if self.queue.full():
+            # The client cannot keep up: drop the backlog, ask it to refetch.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            message = RESYNC
+        self.queue.put_nowait(message)
+
+    async def get(self, timeout):
+        """The next frame, or ``None`` if nothing arrived within ``timeout``."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self):
+        self.broker._unsubscribe(self)
+
+
+class InProcessBroker:
+    """Fan-out to the streams served by this process only."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = {}
+
+    def publish(self, channels, message):
+        with self._lock:
+            targets = [
+                subscription
+                for channel in channels
+                for subscription in self._subscriptions.get(channel, ())
+            ]
+        for subscription in targets:
+            subscription.deliver(message)
+
+    async def subscribe(self, channel):
+        subscription = _LocalSubscription(self, channel)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.channel, None)
+
+
+class _RedisSubscription:
+    def __init__(self, client, pubsub):
+        self.client = client
+        self.pubsub = pubsub
+
+    async def get(self, timeout):
+        message = await self.pubsub.get_message(
+            ignore_subscribe_messages=True, timeout=timeout
+        )
+        return None if message is None else message["data"].decode()
+
+    async def close(self):
+        await self.pubsub.aclose()
+        await self.client.aclose()
+
+
+class RedisBroker:
+    """Fan-out through Redis pub/sub, shared by every process (``pip install redis``)."""
+
+    prefix = "live:"
+
+    def __init__(self, url=None):
+        import redis
+
+        self.url = url or settings.LIVE_UPDATES_REDIS_URL
+        self.client = redis.Redis.from_url(self.url)
+
+    def publish(self, channels, message):
+        pipe = self.client.pipeline(transaction=False)
+        for channel in channels:
+            pipe.publish(self.prefix + channel, message)
+        pipe.execute()
+
+    async def subscribe(self, channel):
+        import redis.asyncio
+
+        client = redis.asyncio.Redis.from_url(self.url)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(self.prefix + channel)
+        return _RedisSubscription(client, pubsub)
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    return import_string(settings.LIVE_UPDATES_BROKER)()
+
+
+# ─── Publishing ──────────────────────────────────────────────────────
+
+
+def publish(event_id, kind, **data):
+    """Send a ``kind`` frame about ``event_id`` once the transaction commits.
+
+    Broker errors are logged, never raised: the change is already saved
+    and admin screens catch up on their next fetch.
+    """
+    message = _frame(kind, {"event_id": event_id, **data})
+    channels = [ALL_EVENTS, event_channel(event_id)]
+    transaction.on_commit(
+        lambda: get_broker().publish(channels, message), robust=True
+    )
+
+
+def publish_status_change(event_id, nominee_ids, from_status, to_status):
+    publish(
+        event_id,
+        "status_changed",
+        nominee_ids=list(nominee_ids),
+        from_status=from_status,
+        to_status=to_status,
+    )
+
+
+def publish_feedback(event_id, feedback, created):
+    publish(
+        event_id,
+        "feedback_submitted",
+        nominee_id=feedback.nominee_id,
+        feedback_id=feedback.id,
+        rating=feedback.rating,
+        created=created,
+    )
+
+
+# ─── Stream ──────────────────────────────────────────────────────────
+
+
+async def _stream(channel):
+    subscription = await get_broker().subscribe(channel)
+    deadline = time.monotonic() + settings.LIVE_UPDATES_MAX_AGE
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Django 4.2 does not notice clients that went away, so
+                # streams end now and then; EventSource reconnects.
+                return
+            message = await subscription.get(
+                min(settings.LIVE_UPDATES_HEARTBEAT, remaining)
+            )
+            yield KEEPALIVE if message is None else message
+    finally:
+        await subscription.close()
+
+
+async def event_stream(request, event_id=None):
+    """SSE stream of ``status_changed`` and ``feedback_submitted`` frames.
+
+    Covers one event, or every event when ``event_id`` is omitted. Each
+    frame's JSON carries ``event_id``; a ``resync`` frame means updates
+    were dropped and the client should refetch.
+    """
+    if request.method != "GET":
+        return JsonResponse(
+            {"detail": f'Method "{request.method}" not allowed.'},
+            status=status.HTTP_405_METHOD_NOT_ALLOWED,
+        )
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"error": "Live updates are only served by the ASGI server."},
+            status=status.HTTP_501_NOT_IMPLEMENTED,
+        )
+    if not await sync_to_async(lambda: request.user.is_authenticated)():
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+    if event_id is not None and not await Event.objects.filter(pk=event_id).aexists():
+        return JsonResponse(
+            {"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND
+        )
+
+    channel = ALL_EVENTS if event_id is None else event_channel(event_id)
+    response = StreamingHttpResponse(_stream(channel), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # stop nginx from buffering frames
+    return response
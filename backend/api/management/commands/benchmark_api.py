@@ -0,0 +1,236 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+import django
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api.models import Event, Feedback, Nominee
+
+BENCHMARK_USER = "benchmark-api"
+
+# name -> (URL template, iterations cap); {event} is the benchmarked event id
+ENDPOINTS = {
+    "event_list": ("/api/events/", None),
+    "event_list_page": ("/api/events/?page_size=50", None),
+    "event_detail": ("/api/events/{event}/", None),
+    "event_detail_fields": ("/api/events/{event}/?fields=id,title", None),
+    "dashboard_summary": ("/api/dashboard/summary/", None),
+    "nominee_list": ("/api/events/{event}/nominees/", None),
+    "nominee_list_page": ("/api/events/{event}/nominees/?page_size=100", None),
+    "event_feedback": ("/api/event/{event}/feedback/", None),
+    "feedback_analytics": ("/api/event/{event}/feedback/analytics/", None),
+    "feedback_trend": ("/api/feedback/analytics/", None),
+    "feedback_csv": ("/api/event/{event}/feedback/download/", None),
+    "feedback_csv_all": ("/api/feedback/download/", 3),
+}
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+class _CacheKeys:
+    """Records the default-cache keys the benchmarked requests read or write.
+
+    Dropping only those keys measures cached endpoints cold without
+    flushing the shared cache (and the sessions kept there) the way
+    ``cache.clear()`` would.
+    """
+
+    METHODS = ("get", "get_many", "set", "set_many")
+
+    def __init__(self):
+        self.cache = caches["default"]
+        self.keys = set()
+
+    def _recording(self, method):
+        def wrapper(key_or_keys, *args, **kwargs):
+            if isinstance(key_or_keys, str):
+                self.keys.add(key_or_keys)
+            else:
+                self.keys.update(key_or_keys)
+            return method(key_or_keys, *args, **kwargs)
+
+        return wrapper
+
+    def __enter__(self):
+        for name in self.METHODS:
+            setattr(self.cache, name, self._recording(getattr(self.cache, name)))
+        return self
+
+    def __exit__(self, *exc_info):
+        for name in self.METHODS:
+            delattr(self.cache, name)
+        self.clear()
+
+    def clear(self):
+        self.cache.delete_many(list(self.keys))
+        self.keys.clear()
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the main API endpoints through the test client against the "
+        "current database (fill it with seed_data first) and print p50/p95 "
+        "latency, query counts and peak memory as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument(
+            "--event",
+            type=int,
+            help="Event to benchmark; defaults to the one with most nominees.",
+        )
+        parser.add_argument(
+            "--only",
+            nargs="+",
+            choices=sorted(ENDPOINTS),
+            help="Benchmark just these endpoints.",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+        parser.add_argument(
+            "--compare",
+            help="Earlier JSON report to print p50 and query-count changes against.",
+        )
+
+    def handle(self, *args, **options):
+        event_id = options["event"] or (
+            Event.objects.order_by("-total_nominees", "id")
+            .values_list("id", flat=True)
+            .first()
+        )
+        if event_id is None:
+            raise CommandError("No events to benchmark; run seed_data first.")
+
+        user, created = User.objects.get_or_create(
+            username=BENCHMARK_USER, defaults={"is_staff": True}
+        )
+        client = Client()
+        client.force_login(user)
+
+        results = {}
+        try:
+            with _CacheKeys() as cache_keys:
+                for name in options["only"] or ENDPOINTS:
+                    url, cap = ENDPOINTS[name]
+                    iterations = min(options["iterations"], cap or options["iterations"])
+                    result = self._measure(
+                        client, url.format(event=event_id), iterations, cache_keys
+                    )
+                    results[name] = result
+                    self.stderr.write(
+                        f"{name}: p50 {result['p50_ms']}ms, {result['queries']} queries"
+                    )
+        finally:
+            client.logout()
+            if created:
+                user.delete()
+
+        report = {
+            "meta": {
+                "commit": _git_commit(),
+                "timestamp": timezone.now().isoformat(),
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "event_id": event_id,
+                "iterations": options["iterations"],
+                "rows": {
+                    "events": Event.objects.count(),
+                    "nominees": Nominee.objects.count(),
+                    "feedback": Feedback.objects.count(),
+                },
+            },
+            "endpoints": results,
+        }
+        text = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as fileobj:
+                fileobj.write(text + "\n")
+        else:
+            self.stdout.write(text)
+        if options["compare"]:
+            self._compare(options["compare"], results)
+
+    def _request(self, client, url):
+        response = client.get(url)
+        # Streaming responses do their work while being consumed.
+        if response.streaming:
+            size = sum(len(chunk) for chunk in response.streaming_content)
+        else:
+            size = len(response.content)
+        if response.status_code != 200:
+            raise CommandError(f"GET {url} returned {response.status_code}")
+        return size
+
+    def _measure(self, client, url, iterations, cache_keys):
+        # Untimed warm-up that also records the keys the endpoint caches.
+        self._request(client, url)
+        timings = []
+        for _ in range(iterations):
+            # Cached endpoints would otherwise measure only cache hits.
+            cache_keys.clear()
+            started = time.perf_counter()
+            size = self._request(client, url)
+            timings.append(time.perf_counter() - started)
+
+        # Query count and peak memory from one extra, separately traced run,
+        # so tracing does not distort the timings above.
+        cache_keys.clear()
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                self._request(client, url)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "url": url,
+            "iterations": iterations,
+            "p50_ms": round(_percentile(timings, 50) * 1000, 2),
+            "p95_ms": round(_percentile(timings, 95) * 1000, 2),
+            "mean_ms": round(statistics.fmean(timings) * 1000, 2),
+            "queries": len(queries),
+            "peak_memory_kb": round(peak / 1024),
+            "response_bytes": size,
+        }
+
+    def _compare(self, path, results):
+        with open(path) as fileobj:
+            before = json.load(fileobj)["endpoints"]
+        self.stderr.write(f"\nChange against {path}:")
+        for name, after in results.items():
+            if name not in before:
+                continue
+            old = before[name]
+            change = (after["p50_ms"] - old["p50_ms"]) / old["p50_ms"] * 100
+            self.stderr.write(
+                f"{name}: p50 {old['p50_ms']} -> {after['p50_ms']}ms "
+                f"({change:+.0f}%), queries {old['queries']} -> {after['queries']}"
+            )
@@ -0,0 +1,74 @@
+import time
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from api.utils import send_batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare one-connection-per-message sending with send_batch() against "
+        "a local aiosmtpd server (pip install aiosmtpd)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=500)
+        parser.add_argument("--port", type=int, default=8025)
+
+    def handle(self, *args, **options):
+        try:
+            from aiosmtpd.controller import Controller
+            from aiosmtpd.handlers import Sink
+        except ImportError:
+            raise CommandError("benchmark_email needs aiosmtpd: pip install aiosmtpd")
+
+        controller = Controller(Sink(), hostname="127.0.0.1", port=options["port"])
+        controller.start()
+        try:
+            with override_settings(
+                EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+                EMAIL_HOST="127.0.0.1",
+                EMAIL_PORT=options["port"],
+                EMAIL_USE_TLS=False,
+                EMAIL_HOST_USER="",
+                EMAIL_HOST_PASSWORD="",
+                EMAIL_BATCH_DELAY=0,
+            ):
+                messages = self._messages(options["messages"])
+                started = time.perf_counter()
+                for message in messages:
+                    message.send(fail_silently=False)
+                single = time.perf_counter() - started
+
+                messages = self._messages(options["messages"])
+                started = time.perf_counter()
+                results = send_batch(messages)
+                batched = time.perf_counter() - started
+        finally:
+            controller.stop()
+
+        failures = sum(1 for _, error in results if error)
+        count = options["messages"]
+        self.stdout.write(
+            f"Connection per message: {single:.3f}s ({count / single:.0f} msg/s)"
+        )
+        self.stdout.write(
+            f"send_batch (chunks of {settings.EMAIL_BATCH_SIZE}): {batched:.3f}s "
+            f"({count / batched:.0f} msg/s), {failures} failure(s)"
+        )
+
+    def _messages(self, count):
+        messages = []
+        for i in range(count):
+            message = EmailMultiAlternatives(
+                subject=f"Benchmark {i}",
+                body="Plain text body",
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[f"nominee{i}@example.com"],
+            )
+            message.attach_alternative("<p>HTML body</p>", "text/html")
+            messages.append(message)
+        return messages
@@ -0,0 +1,83 @@
+import time
+from datetime import date, time as time_of_day
+
+from django.core.mail import EmailMultiAlternatives
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.models import Employee, Event, Nominee
+from api.utils import FeedbackCampaign, InvitationCampaign, _template
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-message render cost of a campaign: full template render "
+        "per recipient versus one event render plus per-recipient fill-in."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--recipients", type=int, default=10000)
+
+    def handle(self, *args, **options):
+        # Unsaved objects: rendering never touches the database.
+        event = Event(
+            id=1,
+            title="Benchmark event",
+            description="Created by benchmark_email_render",
+            date=date.today(),
+            time=time_of_day(9, 0),
+            venue="Benchmark",
+        )
+        nominees = [
+            Nominee(
+                id=i,
+                event=event,
+                employee=Employee(
+                    employee_id=f"EMP{i:06d}",
+                    name=f"Nominee {i}",
+                    email=f"nominee{i}@example.com",
+                ),
+            )
+            for i in range(1, options["recipients"] + 1)
+        ]
+
+        for campaign_class in (InvitationCampaign, FeedbackCampaign):
+            full = self._time(self._full_render, campaign_class, event, nominees)
+            campaign = self._time(self._campaign, campaign_class, event, nominees)
+            count = len(nominees)
+            self.stdout.write(
+                f"{campaign_class.template}: {count} messages, "
+                f"full render {full / count * 1e6:.1f}us/msg, "
+                f"campaign {campaign / count * 1e6:.1f}us/msg "
+                f"({full / campaign:.1f}x)"
+            )
+
+    def _time(self, func, *args):
+        started = time.perf_counter()
+        func(*args)
+        return time.perf_counter() - started
+
+    def _campaign(self, campaign_class, event, nominees):
+        campaign = campaign_class(event)
+        return [campaign.message(nominee) for nominee in nominees]
+
+    def _full_render(self, campaign_class, event, nominees):
+        """Render both templates from scratch for every recipient."""
+        text = _template(f"emails/{campaign_class.template}.txt")
+        html = _template(f"emails/{campaign_class.template}.html")
+        subject = campaign_class.subject.format(event=event)
+        messages = []
+        for nominee in nominees:
+            context = {
+                "event": event,
+                **campaign_class.recipient_values(nominee),
+            }
+            message = EmailMultiAlternatives(
+                subject=subject,
+                body=text.render(context),
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[nominee.employee.email],
+            )
+            message.attach_alternative(html.render(context), "text/html")
+            messages.append(message)
+        return messages
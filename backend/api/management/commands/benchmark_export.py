@@ -0,0 +1,72 @@
+import csv
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.http import HttpResponse
+
+from api.exports import FEEDBACK_CSV_HEADER, feedback_csv
+from api.models import Event, Feedback
+
+
+def buffered_export(event):
+    """The previous implementation: build the whole CSV in an HttpResponse."""
+    response = HttpResponse(content_type="text/csv")
+    writer = csv.writer(response)
+    writer.writerow(FEEDBACK_CSV_HEADER)
+    feedbacks = Feedback.objects.filter(nominee__event=event).select_related(
+        "nominee__employee"
+    )
+    for fb in feedbacks:
+        employee = fb.nominee.employee
+        writer.writerow(
+            [
+                employee.name,
+                employee.email,
+                employee.department,
+                fb.rating,
+                fb.comments,
+                fb.suggestions,
+                fb.submitted_at.strftime("%Y-%m-%d %H:%M:%S"),
+            ]
+        )
+    return [response.content]
+
+
+def measure(produce):
+    """Return (time to first chunk, total time, peak traced MB, bytes)."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    first_chunk = None
+    size = 0
+    for chunk in produce():
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - started
+        size += len(chunk)
+    total = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return first_chunk, total, peak, size
+
+
+class Command(BaseCommand):
+    help = "Compare the buffered and streaming feedback CSV exports for an event."
+
+    def add_arguments(self, parser):
+        parser.add_argument("event_id", type=int)
+
+    def handle(self, *args, **options):
+        try:
+            event = Event.objects.get(pk=options["event_id"])
+        except Event.DoesNotExist:
+            raise CommandError("Event not found.")
+
+        for label, produce in [
+            ("buffered HttpResponse", lambda: buffered_export(event)),
+            ("streaming iterator()", lambda: feedback_csv(event)),
+        ]:
+            first_chunk, total, peak, size = measure(produce)
+            self.stdout.write(
+                f"{label:<22} first byte {first_chunk * 1000:8.1f} ms  "
+                f"total {total * 1000:8.1f} ms  peak {peak:7.2f} MB  {size} bytes"
+            )
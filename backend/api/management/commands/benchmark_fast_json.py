@@ -0,0 +1,123 @@
+import random
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from api.fastjson import dumps, event_feedback_list, nominee_list
+from api.models import Feedback, Nominee
+from api.sample_events import create_sample_event, delete_sample_event
+from api.serializers import FeedbackSerializer, NomineeSerializer
+
+BENCHMARK_TITLE = "Fast JSON benchmark"
+DEPARTMENTS = ["Engineering", "HR", "Finance", "Sales", "Operations"]
+
+
+def _serializer_nominees(event):
+    queryset = Nominee.objects.filter(event=event).select_related(
+        "employee", "feedback"
+    )
+    return JSONRenderer().render(NomineeSerializer(queryset, many=True).data)
+
+
+def _fast_nominees(event):
+    queryset = Nominee.objects.filter(event=event).select_related(
+        "employee", "feedback"
+    )
+    return dumps(nominee_list(queryset))
+
+
+def _serializer_feedback(event):
+    # Mirrors the serializer branch of the event_feedback view.
+    feedbacks = Feedback.objects.filter(nominee__event=event).select_related(
+        "nominee__employee"
+    )
+    data = FeedbackSerializer(feedbacks, many=True).data
+    for item, fb in zip(data, feedbacks):
+        item["nominee_name"] = fb.nominee.employee.name
+        item["nominee_email"] = fb.nominee.employee.email
+        item["nominee_department"] = fb.nominee.employee.department
+    return JSONRenderer().render(data)
+
+
+def _fast_feedback(event):
+    feedbacks = Feedback.objects.filter(nominee__event=event).select_related(
+        "nominee__employee"
+    )
+    return dumps(event_feedback_list(feedbacks))
+
+
+# name -> (serializer path, fast path)
+PAYLOADS = {
+    "nominee_list": (_serializer_nominees, _fast_nominees),
+    "event_feedback": (_serializer_feedback, _fast_feedback),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the serializer and values()-based fast JSON paths for the "
+        "nominee list and event feedback payloads on a throwaway event, and "
+        "check that both produce identical bytes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[10_000, 100_000],
+            help="Nominee counts to benchmark (half of them get feedback).",
+        )
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        for rows in options["rows"]:
+            prefix = f"FASTJSON-{uuid.uuid4().hex[:8]}-"
+            event = self._create_event(rows, options["batch_size"], prefix)
+            try:
+                for name, (slow, fast) in PAYLOADS.items():
+                    self._compare(name, rows, event, slow, fast, options["repeat"])
+            finally:
+                delete_sample_event(event, prefix)
+
+    def _create_event(self, rows, batch_size, prefix):
+        rng = random.Random(rows)
+        return create_sample_event(
+            rows,
+            prefix,
+            statuses=("Accepted", "Attended"),
+            departments=[rng.choice(DEPARTMENTS) for _ in range(rows)],
+            name="Nominee {i} é",
+            feedback=lambda nominee_id: {
+                "rating": rng.randint(1, 5),
+                "comments": f"Useful \"session\"\u2028<{nominee_id}> é",
+                "suggestions": "",
+            },
+            batch_size=batch_size,
+            title=BENCHMARK_TITLE,
+            description="Throwaway event created by benchmark_fast_json.",
+        )
+
+    def _compare(self, name, rows, event, slow, fast, repeat):
+        timings = {}
+        outputs = {}
+        for label, func in (("serializer", slow), ("fast", fast)):
+            best = None
+            for _ in range(repeat):
+                started = time.perf_counter()
+                outputs[label] = func(event)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            timings[label] = best
+
+        if outputs["serializer"] != outputs["fast"]:
+            raise CommandError(f"{name}: fast path output differs at {rows} rows")
+        self.stdout.write(
+            f"{name:14} {rows:>7} rows: serializer {timings['serializer'] * 1000:8.1f}ms, "
+            f"fast {timings['fast'] * 1000:7.1f}ms "
+            f"({timings['serializer'] / timings['fast']:.1f}x), "
+            f"{len(outputs['fast']) / 1024:.0f} KiB identical"
+        )
@@ -0,0 +1,101 @@
+import asyncio
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max
+
+from api.models import OutboxEmail
+from api.sample_events import create_sample_event, delete_sample_event
+
+ENDPOINTS = {
+    "accept": ("GET", "/api/nominee/{pk}/accept/", "Pending"),
+    "info": ("GET", "/api/feedback/{pk}/info/", "Attended"),
+    "feedback": ("POST", "/api/feedback/{pk}/", "Attended"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire concurrent requests at a running server's public endpoints and "
+        "report throughput and latency. Run it once against the WSGI server "
+        "and once against uvicorn with ASYNC_PUBLIC_VIEWS = True."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000")
+        parser.add_argument(
+            "--endpoint", choices=sorted(ENDPOINTS), default="accept"
+        )
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--concurrency", type=int, default=50)
+
+    def handle(self, *args, **options):
+        try:
+            import httpx
+        except ImportError:
+            raise CommandError("benchmark_public_views needs httpx: pip install httpx")
+
+        method, path, nominee_status = ENDPOINTS[options["endpoint"]]
+        outbox_start = OutboxEmail.objects.aggregate(last=Max("id"))["last"] or 0
+        prefix = f"BENCH-{uuid.uuid4().hex[:8]}-"
+        event = create_sample_event(
+            options["requests"],
+            prefix,
+            statuses=(nominee_status,),
+            description="Created by benchmark_public_views",
+        )
+        ids = list(event.nominees.order_by("id").values_list("id", flat=True))
+        urls = [options["url"].rstrip("/") + path.format(pk=pk) for pk in ids]
+
+        try:
+            latencies, failures, elapsed = asyncio.run(
+                self._run(httpx, method, urls, options["concurrency"])
+            )
+        finally:
+            delete_sample_event(event, prefix)
+            OutboxEmail.objects.filter(id__gt=outbox_start).delete()
+
+        latencies.sort()
+        self.stdout.write(
+            f"{len(urls)} {options['endpoint']} requests, "
+            f"concurrency {options['concurrency']}: {elapsed:.2f}s, "
+            f"{len(urls) / elapsed:.0f} req/s"
+        )
+        if latencies:
+            p50 = latencies[len(latencies) // 2]
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            self.stdout.write(f"p50 {p50 * 1000:.1f}ms, p95 {p95 * 1000:.1f}ms")
+        if failures:
+            self.stdout.write(self.style.WARNING(f"{failures} failed requests"))
+
+    async def _run(self, httpx, method, urls, concurrency):
+        latencies, failures = [], 0
+        queue = asyncio.Queue()
+        for url in urls:
+            queue.put_nowait(url)
+
+        async def worker(client):
+            nonlocal failures
+            while not queue.empty():
+                url = queue.get_nowait()
+                started = time.perf_counter()
+                try:
+                    if method == "POST":
+                        response = await client.post(url, json={"rating": 5})
+                    else:
+                        response = await client.get(url)
+                except httpx.HTTPError:
+                    failures += 1
+                    continue
+                if response.status_code >= 400:
+                    failures += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+        return latencies, failures, elapsed
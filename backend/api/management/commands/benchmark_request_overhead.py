@@ -0,0 +1,115 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import User
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext, override_settings
+
+BENCHMARK_USER = "benchmark-overhead"
+PATHS = {"check_auth": "/api/check-auth/", "event_list": "/api/events/"}
+
+# (label, CONN_MAX_AGE, CONN_HEALTH_CHECKS, session settings)
+PROFILES = [
+    ("before", 0, False, {"SESSION_ENGINE": "django.contrib.sessions.backends.db"}),
+    (
+        "after",
+        600,
+        True,
+        {
+            "SESSION_ENGINE": "django.contrib.sessions.backends.cached_db",
+            "SESSION_CACHE_ALIAS": "default",
+        },
+    ),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-request overhead of check_auth and event_list_create with "
+        "the base settings (new connection and session SELECT per request) "
+        "and with the production profile (persistent connection, cached_db "
+        "sessions). Requests go through the real WSGI handler, so connections "
+        "are opened and closed exactly as in a deployment."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+
+    def handle(self, *args, **options):
+        user, created = User.objects.get_or_create(
+            username=BENCHMARK_USER, defaults={"is_staff": True}
+        )
+        self.opened = 0
+        connection_created.connect(
+            self._count_connection, weak=False, dispatch_uid=BENCHMARK_USER
+        )
+        original = {
+            key: connection.settings_dict[key]
+            for key in ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS")
+        }
+        try:
+            for label, max_age, health_checks, session_settings in PROFILES:
+                connection.close()
+                connection.settings_dict["CONN_MAX_AGE"] = max_age
+                connection.settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+                with override_settings(**session_settings):
+                    # A fresh session per profile, so nothing else in the
+                    # session store has to be cleared.
+                    session = self._login(user)
+                    cookie = f"{settings.SESSION_COOKIE_NAME}={session.session_key}"
+                    handler = WSGIHandler()
+                    try:
+                        for name, path in PATHS.items():
+                            self._report(
+                                label, name, handler, path, cookie, options["requests"]
+                            )
+                    finally:
+                        session.delete()
+        finally:
+            connection.close()
+            connection.settings_dict.update(original)
+            connection_created.disconnect(dispatch_uid=BENCHMARK_USER)
+            if created:
+                user.delete()
+
+    def _count_connection(self, **kwargs):
+        self.opened += 1
+
+    def _login(self, user):
+        """Log ``user`` in through the configured session engine."""
+        store = import_module(settings.SESSION_ENGINE).SessionStore()
+        store[SESSION_KEY] = str(user.pk)
+        store[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+        store[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        store.save()
+        return store
+
+    def _report(self, label, name, handler, path, cookie, count):
+        environ = RequestFactory().get(path, HTTP_COOKIE=cookie).environ
+
+        def start_response(status, headers):
+            assert status.startswith("200"), f"GET {path} returned {status}"
+
+        def request():
+            response = handler(dict(environ), start_response)
+            response.close()  # fires request_finished, which may close the DB
+
+        request()  # warm-up
+        with CaptureQueriesContext(connection) as queries:
+            self.opened = 0
+            started = time.perf_counter()
+            for _ in range(count):
+                request()
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{label:6} {name:11} {elapsed / count * 1000:6.2f}ms/request, "
+            f"{len(queries) / count:.1f} queries/request, "
+            f"{self.opened} connection(s) opened"
+        )
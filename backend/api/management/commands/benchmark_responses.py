@@ -0,0 +1,92 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+from django.db.models import Max
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from api.models import OutboxEmail
+from api.sample_events import create_sample_event, delete_sample_event
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the public accept link: hits per second, queries per hit, "
+        "and how many of several simultaneous clicks on one link win."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--nominees", type=int, default=500)
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=1,
+            help="Concurrent clients (use >1 only on MySQL; SQLite locks).",
+        )
+        parser.add_argument(
+            "--double-clicks",
+            type=int,
+            default=0,
+            help="Also fire this many simultaneous clicks at one nominee.",
+        )
+
+    def handle(self, *args, **options):
+        outbox_start = OutboxEmail.objects.aggregate(last=Max("id"))["last"] or 0
+        prefix = f"BENCH-{uuid.uuid4().hex[:8]}-"
+        event = create_sample_event(
+            options["nominees"] + 1,
+            prefix,
+            description="Created by benchmark_responses",
+        )
+        ids = list(event.nominees.order_by("id").values_list("id", flat=True))
+        target, ids = ids[0], ids[1:]
+
+        try:
+            self._throughput(ids, options["threads"])
+            if options["double_clicks"]:
+                self._double_click(target, options["double_clicks"])
+        finally:
+            delete_sample_event(event, prefix)
+            OutboxEmail.objects.filter(id__gt=outbox_start).delete()
+
+    def _throughput(self, ids, threads):
+        def hit(chunk):
+            client = Client()
+            try:
+                for pk in chunk:
+                    client.get(f"/api/nominee/{pk}/accept/")
+            finally:
+                close_old_connections()
+
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            if threads == 1:
+                hit(ids)
+            else:
+                with ThreadPoolExecutor(max_workers=threads) as pool:
+                    list(pool.map(hit, [ids[i::threads] for i in range(threads)]))
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f"{len(ids)} accept clicks in {elapsed:.2f}s: "
+            f"{len(ids) / elapsed:.0f} hits/s"
+        )
+        if threads == 1:
+            self.stdout.write(f"{len(queries) / len(ids):.1f} queries per hit")
+
+    def _double_click(self, pk, clicks):
+        def click(_):
+            try:
+                return Client().get(f"/api/nominee/{pk}/accept/")["Location"]
+            finally:
+                close_old_connections()
+
+        with ThreadPoolExecutor(max_workers=clicks) as pool:
+            locations = list(pool.map(click, range(clicks)))
+        accepted = sum("status=accepted" in location for location in locations)
+        self.stdout.write(
+            f"{clicks} simultaneous clicks: {accepted} accepted the invitation"
+        )
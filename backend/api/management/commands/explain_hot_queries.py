@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import Event, Nominee, Feedback
+
+# Plan text of a sort step (SQLite, MySQL); ordered queries must read their
+# index in order instead.
+SORT_MARKERS = ("TEMP B-TREE", "filesort")
+
+
+def hot_queries(event_id):
+    """The queries the API runs most, paired with the indexes they should use."""
+    return [
+        (
+            "Nominees of an event by status",
+            Nominee.objects.filter(event_id=event_id, status="Attended").order_by(),
+            ["nominee_event_status_idx"],
+        ),
+        (
+            "Nominees of an event in default order",
+            Nominee.objects.filter(event_id=event_id)[:50],
+            ["nominee_event_employee_idx"],
+        ),
+        (
+            "Nominee page after a cursor",
+            Nominee.objects.filter(event_id=event_id, employee_id__gt="EMP001")[:50],
+            ["nominee_event_employee_idx"],
+        ),
+        (
+            "Nominee dedupe by employee id",
+            Nominee.objects.filter(event_id=event_id, employee_id="EMP001").order_by(),
+            ["nominee_event_employee_idx"],
+        ),
+        (
+            "Latest events",
+            Event.objects.order_by("-created_at")[:50],
+            ["event_created_at_idx"],
+        ),
+        (
+            "Feedback of an event",
+            Feedback.objects.filter(nominee__event_id=event_id),
+            ["api_nominee_event_id", "nominee_event_"],
+        ),
+    ]
+
+
+class Command(BaseCommand):
+    help = "Print EXPLAIN plans for the hot API queries and check their indexes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--event-id", type=int, default=1)
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error if any query misses its index or sorts.",
+        )
+
+    def handle(self, *args, **options):
+        missing = []
+        for label, queryset, indexes in hot_queries(options["event_id"]):
+            plan = queryset.explain()
+            used = any(index in plan for index in indexes)
+            sorts = any(marker in plan for marker in SORT_MARKERS)
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(plan)
+            if used and not sorts:
+                self.stdout.write(self.style.SUCCESS("  uses expected index\n"))
+            else:
+                problem = "sorts its rows" if used else "expected index not used"
+                self.stdout.write(self.style.WARNING(f"  {problem}\n"))
+                missing.append(label)
+
+        if missing and options["check"]:
+            raise CommandError(
+                f"Queries not using their index in order: {', '.join(missing)}"
+            )
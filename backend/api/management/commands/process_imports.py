@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.imports import claim_pending_job, run_import_job
+
+
+class Command(BaseCommand):
+    help = "Process uploaded nominee spreadsheets queued as import jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep when no import is waiting.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the waiting imports and exit instead of polling.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            job = claim_pending_job()
+            if job is None:
+                if options["once"]:
+                    return
+                time.sleep(options["poll_interval"])
+                continue
+
+            run_import_job(job)
+            self.stdout.write(
+                f"Import {job.id} {job.status.lower()}: {job.created_count} created, "
+                f"{job.duplicate_count} duplicate, {job.invalid_count} invalid."
+            )
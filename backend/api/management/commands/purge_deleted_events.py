@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.purge import next_hidden_event, purge_event
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete events hidden by a background DELETE, removing their nominees "
+        "and feedback in small raw-SQL batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Nominees deleted per transaction (default EVENT_PURGE_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep when no event is waiting.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Purge the waiting events and exit instead of polling.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            event = next_hidden_event()
+            if event is None:
+                if options["once"]:
+                    return
+                time.sleep(options["poll_interval"])
+                continue
+
+            started = time.perf_counter()
+            deleted = purge_event(event, options["batch_size"])
+            self.stdout.write(
+                f"Purged event {event.id} ({event.title}): {deleted} nominee(s) "
+                f"in {time.perf_counter() - started:.1f}s."
+            )
@@ -0,0 +1,79 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from api.models import Event, Feedback, Nominee
+
+
+def _count(queryset, event_path, **filters):
+    """Correlated ``COUNT(*)`` of ``queryset`` rows for the outer event."""
+    counts = (
+        queryset.filter(**{event_path: OuterRef("pk")}, **filters)
+        .order_by()
+        .values(event_path)
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def live_counts():
+    """Counter values as subqueries over the nominee rows, for ``update()``."""
+    counts = {
+        "total_nominees": _count(Nominee.objects, "event"),
+        "feedback_count": _count(Feedback.objects, "nominee__event"),
+    }
+    for status, field in Nominee.COUNT_FIELDS.items():
+        counts[field] = _count(Nominee.objects, "event", status=status)
+    return counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized nominee counters on Event and fix drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--event-id",
+            type=int,
+            action="append",
+            dest="event_ids",
+            help="Only recount this event (repeatable). Defaults to all events.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        events = Event.objects.order_by("id").only("id", *Event.COUNTER_FIELDS)
+        if options["event_ids"]:
+            events = events.filter(id__in=options["event_ids"])
+
+        checked = repaired = 0
+        last_id = 0
+        while True:
+            batch = list(
+                events.filter(id__gt=last_id).with_live_counts()[: options["batch_size"]]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            drifted = [
+                event.id
+                for event in batch
+                if any(
+                    getattr(event, field) != getattr(event, f"live_{field}")
+                    for field in Event.COUNTER_FIELDS
+                )
+            ]
+            if drifted:
+                # Recount inside the UPDATE itself: values read above could
+                # already be stale, and writing them back would undo any F()
+                # adjustment made since. Bumping updated_at retires ETags and
+                # cached analytics.
+                Event.objects.filter(id__in=drifted).update(
+                    updated_at=timezone.now(), **live_counts()
+                )
+            checked += len(batch)
+            repaired += len(drifted)
+
+        self.stdout.write(f"Checked {checked} event(s), repaired {repaired}.")
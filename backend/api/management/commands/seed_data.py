@@ -0,0 +1,175 @@
+import random
+import time
+from datetime import date, time as time_of_day, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from api.models import Employee, Event, Feedback, Nominee
+
+TITLE_PREFIX = "Seed event "
+EMPLOYEE_PREFIX = "SEED"  # keeps seeded people apart from real directory rows
+DEPARTMENTS = ["Engineering", "Finance", "HR", "Marketing", "Operations", "Sales"]
+# Status mix of seeded nominees, as (status, weight)
+STATUS_WEIGHTS = [
+    ("Pending", 30),
+    ("Accepted", 25),
+    ("Rejected", 10),
+    ("Attended", 35),
+]
+MINUTES_BACK = 60 * 24 * 30  # Responses spread over the last 30 days
+COMMENTS = ["", "Very useful.", "Too long.", "Great trainer!", "More examples please."]
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic events, nominees and feedback for benchmarking. "
+        "The same --seed always produces the same data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=100)
+        parser.add_argument(
+            "--nominees",
+            type=int,
+            default=100,
+            help="Nominees per event.",
+        )
+        parser.add_argument(
+            "--feedback-ratio",
+            type=float,
+            default=0.6,
+            help="Share of attended nominees that submitted feedback.",
+        )
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete previously seeded events (and their nominees) first.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        seeded = Event.objects.filter(title__startswith=TITLE_PREFIX)
+        if options["clear"]:
+            deleted, _ = seeded.delete()
+            deleted += Employee.objects.filter(
+                employee_id__startswith=EMPLOYEE_PREFIX
+            ).unreferenced().delete()[0]
+            self.stdout.write(f"Deleted {deleted} seeded row(s).")
+        elif seeded.exists():
+            raise CommandError(
+                "Seeded events already exist; pass --clear to replace them."
+            )
+
+        rng = random.Random(options["seed"])
+        # Event dates cycle through a year centred on today, so some are upcoming.
+        first_day = date.today() - timedelta(days=182)
+        totals = {"events": 0, "nominees": 0, "feedback": 0}
+
+        per_event = max(1, options["nominees"])
+        events_per_batch = max(1, options["batch_size"] // per_event)
+        for start in range(0, options["events"], events_per_batch):
+            numbers = range(start, min(start + events_per_batch, options["events"]))
+            with transaction.atomic():
+                counts = self._seed_batch(rng, numbers, first_day, options)
+            for key, value in counts.items():
+                totals[key] += value
+            self.stdout.write(
+                f"{totals['events']} events, {totals['nominees']} nominees, "
+                f"{totals['feedback']} feedback",
+                ending="\r",
+            )
+
+        self.stdout.write("")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {totals['events']} events, {totals['nominees']} nominees "
+                f"and {totals['feedback']} feedback rows "
+                f"in {time.perf_counter() - started:.1f}s."
+            )
+        )
+
+    def _seed_batch(self, rng, numbers, first_day, options):
+        statuses, weights = zip(*STATUS_WEIGHTS)
+        now = timezone.now()
+        events, nominee_statuses = [], []
+        for number in numbers:
+            picked = rng.choices(statuses, weights, k=options["nominees"])
+            nominee_statuses.append(picked)
+            event = Event(
+                title=f"{TITLE_PREFIX}{number:07d}",
+                description=f"Synthetic event {number} created by seed_data.",
+                date=first_day + timedelta(days=number % 365),
+                time=time_of_day(9 + number % 8, 0),
+                venue=f"Room {number % 20 + 1}",
+                total_nominees=len(picked),
+            )
+            for status in statuses:
+                setattr(event, Nominee.COUNT_FIELDS[status], picked.count(status))
+            events.append(event)
+        Event.objects.bulk_create(events)
+
+        # MySQL does not return ids from bulk_create, so look them up.
+        ids = dict(
+            Event.objects.filter(title__in=[event.title for event in events])
+            .order_by()
+            .values_list("title", "id")
+        )
+        # The i-th nominee of every event is the same seeded employee.
+        Employee.objects.add_missing(
+            [
+                Employee(
+                    employee_id=f"{EMPLOYEE_PREFIX}{i:07d}",
+                    name=f"Nominee {i}",
+                    email=f"nominee{i}@example.com",
+                    department=rng.choice(DEPARTMENTS),
+                )
+                for i in range(options["nominees"])
+            ]
+        )
+        nominees = []
+        for event, picked in zip(events, nominee_statuses):
+            event.id = ids[event.title]
+            for i, status in enumerate(picked):
+                nominees.append(
+                    Nominee(
+                        event_id=event.id,
+                        employee_id=f"{EMPLOYEE_PREFIX}{i:07d}",
+                        status=status,
+                        status_changed_at=(
+                            None
+                            if status == "Pending"
+                            else now - timedelta(minutes=rng.randrange(MINUTES_BACK))
+                        ),
+                    )
+                )
+        Nominee.objects.bulk_create(nominees, batch_size=options["batch_size"])
+
+        attended = (
+            Nominee.objects.filter(event_id__in=ids.values(), status="Attended")
+            .order_by("id")
+            .values_list("id", "event_id")
+        )
+        feedback, feedback_counts = [], {}
+        for nominee_id, event_id in attended.iterator():
+            if rng.random() < options["feedback_ratio"]:
+                feedback.append(
+                    Feedback(
+                        nominee_id=nominee_id,
+                        rating=rng.choices(range(1, 6), weights=[1, 2, 4, 6, 4])[0],
+                        comments=rng.choice(COMMENTS),
+                    )
+                )
+                feedback_counts[event_id] = feedback_counts.get(event_id, 0) + 1
+        Feedback.objects.bulk_create(feedback, batch_size=options["batch_size"])
+        for event_id, count in feedback_counts.items():
+            Event.objects.filter(pk=event_id).update(feedback_count=count)
+
+        return {
+            "events": len(events),
+            "nominees": len(nominees),
+            "feedback": len(feedback),
+        }
@@ -0,0 +1,70 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.metrics import serve_metrics
+from api.outbox import claim_due, deliver
+
+
+class Command(BaseCommand):
+    help = "Deliver queued emails from the outbox, retrying failures with backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Emails per batch; at most EMAIL_BATCH_SIZE, the default.",
+        )
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--max-attempts", type=int, default=5)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the currently due emails and exit instead of polling.",
+        )
+        parser.add_argument(
+            "--metrics-port",
+            type=int,
+            help="Serve this worker's email send metrics on :PORT/metrics.",
+        )
+
+    def handle(self, *args, **options):
+        if options["metrics_port"] is not None:
+            if not settings.REQUEST_METRICS_ENABLED:
+                raise CommandError("--metrics-port needs REQUEST_METRICS_ENABLED.")
+            serve_metrics(options["metrics_port"])
+        # At most one batch of EMAIL_BATCH_SIZE per EMAIL_BATCH_DELAY seconds,
+        # however many threads share it, to stay under provider rate limits.
+        batch_size = min(
+            options["batch_size"] or settings.EMAIL_BATCH_SIZE,
+            settings.EMAIL_BATCH_SIZE,
+        )
+        last_batch = None
+        while True:
+            if last_batch is not None:
+                pause = settings.EMAIL_BATCH_DELAY - (time.monotonic() - last_batch)
+                if pause > 0:
+                    time.sleep(pause)
+            rows = claim_due(batch_size)
+            if not rows:
+                if options["once"]:
+                    return
+                last_batch = None
+                time.sleep(options["poll_interval"])
+                continue
+
+            last_batch = time.monotonic()
+
+            sent, retried, failed = deliver(
+                rows, options["workers"], options["max_attempts"]
+            )
+            self.stdout.write(
+                f"Sent {sent}, will retry {retried}, gave up on {failed} email(s)."
+            )
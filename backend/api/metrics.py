@@ -0,0 +1,305 @@
+"""In-process request metrics, exported in the Prometheus text format.
+
+``RequestMetricsMiddleware`` is installed in ``MIDDLEWARE`` but only
+active with ``REQUEST_METRICS_ENABLED = True``. It records, per URL name,
+request latency, SQL query count and SQL time, and logs requests slower
+than ``SLOW_REQUEST_THRESHOLD`` seconds with their costliest SQL. Email
+send time is recorded by ``send_batch`` in the ``send_outbox`` worker,
+which serves it with ``serve_metrics``.
+
+Each process keeps its own numbers, like ``prometheus_client`` does
+without multiprocess mode, so scrape every web and outbox worker process.
+
+SQL is counted on the connection of the thread that serves the request:
+the worker thread under WSGI, and under ASGI the request's thread-sensitive
+sync thread, which runs sync views and ``sync_to_async`` calls. Queries
+that run while a streaming response is being consumed happen after the
+middleware has returned, and queries made from other threads (e.g.
+``sync_to_async(thread_sensitive=False)``) are not counted.
+"""
+
+import hmac
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import Http404, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+SLOW_SQL_SHOWN = 3
+SQL_PREVIEW_CHARS = 300
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Cumulative-bucket histogram as Prometheus expects it."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def samples(self, name, labels):
+        cumulative = 0
+        for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+            cumulative += count
+            yield f"{name}_bucket", {**labels, "le": str(bound)}, cumulative
+        yield f"{name}_sum", labels, self.sum
+        yield f"{name}_count", labels, cumulative
+
+
+class Registry:
+    """Thread-safe store of the metric families, keyed by label values."""
+
+    FAMILIES = {
+        "http_request_duration_seconds": (
+            "histogram",
+            "Request latency by URL name.",
+            LATENCY_BUCKETS,
+        ),
+        "http_request_db_queries": (
+            "histogram",
+            "SQL queries per request by URL name.",
+            QUERY_COUNT_BUCKETS,
+        ),
+        "http_request_db_seconds_total": (
+            "counter",
+            "Time spent in SQL by URL name.",
+            None,
+        ),
+        "http_requests_total": (
+            "counter",
+            "Requests by URL name, method and status code.",
+            None,
+        ),
+        "email_send_seconds": (
+            "histogram",
+            "Time to hand one email to the SMTP server, by outcome.",
+            LATENCY_BUCKETS,
+        ),
+    }
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.values = {name: {} for name in self.FAMILIES}
+
+    def observe(self, name, value, **labels):
+        key = tuple(sorted(labels.items()))
+        buckets = self.FAMILIES[name][2]
+        with self.lock:
+            family = self.values[name]
+            if buckets is None:
+                family[key] = family.get(key, 0) + value
+            else:
+                family.setdefault(key, Histogram(buckets)).observe(value)
+
+    def render(self):
+        lines = []
+        with self.lock:
+            for name, (kind, help_text, buckets) in self.FAMILIES.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for key, value in sorted(self.values[name].items()):
+                    labels = dict(key)
+                    if buckets is None:
+                        samples = [(name, labels, value)]
+                    else:
+                        samples = value.samples(name, labels)
+                    for sample, sample_labels, number in samples:
+                        lines.append(
+                            f"{sample}{_format_labels(sample_labels)} {number!r}"
+                        )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+registry = Registry()
+
+
+def observe_email(seconds, ok):
+    if settings.REQUEST_METRICS_ENABLED:
+        outcome = "sent" if ok else "failed"
+        registry.observe("email_send_seconds", seconds, outcome=outcome)
+
+
+class _QueryRecorder:
+    """``connection.execute_wrapper`` that times every query of a request."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.by_sql = defaultdict(lambda: [0, 0.0])
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.seconds += elapsed
+            # Placeholders keep N+1 repeats of one statement under one key.
+            entry = self.by_sql[sql]
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def top(self, limit):
+        return sorted(self.by_sql.items(), key=lambda item: -item[1][1])[:limit]
+
+
+def _install(recorder):
+    connection.execute_wrappers.append(recorder)
+
+
+def _uninstall(recorder):
+    connection.execute_wrappers.remove(recorder)
+
+
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        recorder = _QueryRecorder()
+        started = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        self._record(request, response, time.perf_counter() - started, recorder)
+        return response
+
+    async def __acall__(self, request):
+        recorder = _QueryRecorder()
+        # The request's SQL runs in its sync thread, not on the event loop.
+        await sync_to_async(_install)(recorder)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(_uninstall)(recorder)
+        self._record(request, response, time.perf_counter() - started, recorder)
+        return response
+
+    def _record(self, request, response, elapsed, recorder):
+        match = getattr(request, "resolver_match", None)
+        # Unresolved paths share one label so scanners cannot blow up cardinality.
+        view = (match.view_name if match else None) or "unmatched"
+        registry.observe(
+            "http_request_duration_seconds", elapsed, view=view, method=request.method
+        )
+        registry.observe("http_request_db_queries", recorder.count, view=view)
+        registry.observe("http_request_db_seconds_total", recorder.seconds, view=view)
+        registry.observe(
+            "http_requests_total",
+            1,
+            view=view,
+            method=request.method,
+            status=response.status_code,
+        )
+
+        if elapsed >= settings.SLOW_REQUEST_THRESHOLD:
+            self._log_slow(request, view, elapsed, recorder)
+
+    def _log_slow(self, request, view, elapsed, recorder):
+        top = "".join(
+            f"\n  {count}x {seconds * 1000:.1f}ms: {sql[:SQL_PREVIEW_CHARS]}"
+            for sql, (count, seconds) in recorder.top(SLOW_SQL_SHOWN)
+        )
+        logger.warning(
+            "Slow request %s %s (%s): %.3fs, %d queries in %.3fs%s",
+            request.method,
+            request.path,
+            view,
+            elapsed,
+            recorder.count,
+            recorder.seconds,
+            top,
+        )
+
+
+def _refused(authorization):
+    """The status refusing a scrape with this ``Authorization``, or ``None``.
+
+    With no ``METRICS_TOKEN`` configured every scrape is refused.
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        return 403
+    if not hmac.compare_digest(authorization, f"Bearer {token}"):
+        return 401
+    return None
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint; needs ``Authorization: Bearer <METRICS_TOKEN>``."""
+    if not settings.REQUEST_METRICS_ENABLED:
+        raise Http404
+    refused = _refused(request.headers.get("Authorization", ""))
+    if refused:
+        return HttpResponse(status=refused)
+    return HttpResponse(registry.render(), content_type=CONTENT_TYPE)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.partition("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        refused = _refused(self.headers.get("Authorization", ""))
+        body = b"" if refused else registry.render().encode()
+        self.send_response(refused or 200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Prometheus scrapes every few seconds; keep the worker's output clean.
+        pass
+
+
+def serve_metrics(port, host=""):
+    """Serve ``/metrics`` from a daemon thread, for processes without a web server.
+
+    Uses the same token check as ``metrics_view``. Returns the server;
+    ``server.shutdown()`` stops it.
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
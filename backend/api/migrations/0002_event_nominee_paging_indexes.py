@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-17 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['-created_at'], name='event_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='nominee',
+            index=models.Index(fields=['event', 'name'], name='nominee_event_name_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-17 21:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_event_nominee_paging_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='nominee',
+            index=models.Index(fields=['event', 'status'], name='nominee_event_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='nominee',
+            index=models.Index(fields=['event', 'employee_id'], name='nominee_event_employee_idx'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 4.2 on 2026-10-17 21:54
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_counters(apps, schema_editor):
+    Event = apps.get_model("api", "Event")
+    Nominee = apps.get_model("api", "Nominee")
+    Feedback = apps.get_model("api", "Feedback")
+    status_fields = {
+        "Pending": "pending_count",
+        "Accepted": "accepted_count",
+        "Rejected": "rejected_count",
+        "Attended": "attended_count",
+    }
+
+    counts = {}
+    by_status = (
+        Nominee.objects.order_by()
+        .values("event_id", "status")
+        .annotate(n=Count("id"))
+    )
+    for row in by_status:
+        event_counts = counts.setdefault(row["event_id"], {"total_nominees": 0})
+        event_counts["total_nominees"] += row["n"]
+        event_counts[status_fields[row["status"]]] = row["n"]
+    by_feedback = (
+        Feedback.objects.order_by()
+        .values("nominee__event_id")
+        .annotate(n=Count("id"))
+    )
+    for row in by_feedback:
+        counts.setdefault(row["nominee__event_id"], {})["feedback_count"] = row["n"]
+
+    for event_id, fields in counts.items():
+        Event.objects.filter(pk=event_id).update(**fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_importjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='accepted_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='attended_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='feedback_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='pending_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='rejected_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='total_nominees',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2 on 2026-10-17 21:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_event_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='nominee',
+            name='status_changed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='nominee',
+            index=models.Index(fields=['-status_changed_at'], name='nominee_status_changed_idx'),
+        ),
+    ]
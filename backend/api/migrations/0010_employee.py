@@ -0,0 +1,98 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def create_employees(apps, schema_editor):
+    """One Employee per distinct nominee employee ID.
+
+    Reads nominees ordered by ID, newest nomination first, and keeps the
+    first row of each run, so memory stays flat on large tables.
+    """
+    Employee = apps.get_model("api", "Employee")
+    Nominee = apps.get_model("api", "Nominee")
+    rows = (
+        Nominee.objects.order_by("employee_id", "-id")
+        .values_list("employee_id", "name", "email", "department")
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    batch = []
+    previous = None
+    for employee_id, name, email, department in rows:
+        if employee_id == previous:
+            continue
+        previous = employee_id
+        batch.append(
+            Employee(
+                employee_id=employee_id, name=name, email=email, department=department
+            )
+        )
+        if len(batch) >= BATCH_SIZE:
+            # ignore_conflicts: IDs differing only in case collide on MySQL.
+            Employee.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        Employee.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0009_event_deleted_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Employee",
+            fields=[
+                (
+                    "employee_id",
+                    models.CharField(max_length=50, primary_key=True, serialize=False),
+                ),
+                ("name", models.CharField(max_length=255)),
+                ("email", models.EmailField(max_length=254)),
+                ("department", models.CharField(max_length=255)),
+            ],
+            options={
+                "ordering": ["employee_id"],
+                "indexes": [
+                    models.Index(fields=["department"], name="employee_department_idx")
+                ],
+            },
+        ),
+        migrations.RunPython(create_employees, migrations.RunPython.noop),
+        # Rename employee_id -> employee in the model state only: the column
+        # and the (event, employee_id) index already have the right names.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name="nominee", name="nominee_event_employee_idx"
+                ),
+                migrations.RenameField(
+                    model_name="nominee", old_name="employee_id", new_name="employee"
+                ),
+                migrations.AlterField(
+                    model_name="nominee",
+                    name="employee",
+                    field=models.CharField(max_length=50, db_column="employee_id"),
+                ),
+                migrations.AddIndex(
+                    model_name="nominee",
+                    index=models.Index(
+                        fields=["event", "employee"], name="nominee_event_employee_idx"
+                    ),
+                ),
+            ],
+        ),
+        # Same column and type; this only adds the foreign key and its index.
+        migrations.AlterField(
+            model_name="nominee",
+            name="employee",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="nominations",
+                to="api.employee",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2 on 2026-10-17 22:35
+
+from django.db import migrations, models
+
+
+def start_running_leases(apps, schema_editor):
+    # Imports already running get a lease from their upload time, so the
+    # ones whose worker has gone are reclaimed like any other.
+    ImportJob = apps.get_model('api', 'ImportJob')
+    ImportJob.objects.filter(status='Running').update(heartbeat_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_employee'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(start_running_leases, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+DETAIL_FIELDS = ["name", "email", "department"]
+
+
+def restore_nominee_details(apps, schema_editor):
+    """Copy each nominee's details back from its Employee row."""
+    Employee = apps.get_model("api", "Employee")
+    Nominee = apps.get_model("api", "Nominee")
+    employee = Employee.objects.filter(pk=OuterRef("employee_id"))
+    Nominee.objects.update(
+        **{field: Subquery(employee.values(field)[:1]) for field in DETAIL_FIELDS}
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0011_importjob_heartbeat_at"),
+    ]
+
+    # Every nominee already references an Employee row (0010) with the same
+    # details, so only the per-nomination copies go. The defaults only let
+    # the columns be re-added to a populated table when migrating back.
+    operations = [
+        migrations.AlterModelOptions(
+            name="nominee",
+            options={"ordering": ["employee__name"]},
+        ),
+        migrations.RemoveIndex(
+            model_name="nominee",
+            name="nominee_event_name_idx",
+        ),
+        migrations.AlterField(
+            model_name="nominee",
+            name="name",
+            field=models.CharField(max_length=255, default=""),
+        ),
+        migrations.AlterField(
+            model_name="nominee",
+            name="email",
+            field=models.EmailField(max_length=254, default=""),
+        ),
+        migrations.AlterField(
+            model_name="nominee",
+            name="department",
+            field=models.CharField(max_length=255, default=""),
+        ),
+        migrations.RunPython(migrations.RunPython.noop, restore_nominee_details),
+        migrations.RemoveField(
+            model_name="nominee",
+            name="name",
+        ),
+        migrations.RemoveField(
+            model_name="nominee",
+            name="email",
+        ),
+        migrations.RemoveField(
+            model_name="nominee",
+            name="department",
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-17 22:58
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_remove_nominee_details'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='nominee',
+            options={'ordering': ['employee_id']},
+        ),
+    ]
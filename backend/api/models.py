@@ -1,4 +1,52 @@
-from django.db import models
+from django.core.mail import EmailMultiAlternatives
+from django.db import models, transaction
+from django.db.models import Count, F, Prefetch, Q
+from django.utils import timezone
+
+
+class EventQuerySet(models.QuerySet):
+    def with_live_counts(self):
+        """Annotate counts computed from the nominee rows, as ``live_<field>``.
+
+        Used to check the denormalized counters. Django drops
+        ``Meta.ordering`` on GROUP BY queries, so callers must apply
+        ``order_by()`` themselves.
+        """
+        return self.annotate(
+            live_total_nominees=Count("nominees"),
+            live_accepted_count=Count("nominees", filter=Q(nominees__status="Accepted")),
+            live_rejected_count=Count("nominees", filter=Q(nominees__status="Rejected")),
+            live_pending_count=Count("nominees", filter=Q(nominees__status="Pending")),
+            live_attended_count=Count("nominees", filter=Q(nominees__status="Attended")),
+            live_feedback_count=Count("nominees__feedback"),
+        )
+
+    def adjust_counts(self, **deltas):
+        """Atomically add ``deltas`` to counter columns, e.g. ``pending_count=-1``."""
+        return self.update(
+            updated_at=timezone.now(),
+            **{field: F(field) + delta for field, delta in deltas.items()},
+        )
+
+    def touch(self):
+        """Bump ``updated_at`` after a change to an event's nominees or feedback."""
+        return self.update(updated_at=timezone.now())
+
+    def with_nominees(self):
+        """Prefetch nominees with their employee and feedback in one extra query."""
+        return self.prefetch_related(
+            Prefetch(
+                "nominees",
+                queryset=Nominee.objects.select_related("employee", "feedback"),
+            )
+        )
+
+
+class EventManager(models.Manager.from_queryset(EventQuerySet)):
+    """Leaves out events hidden by a background delete (see ``api.purge``)."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
 
 
 class Event(models.Model):
@@ -8,14 +56,129 @@ class Event(models.Model):
     time = models.TimeField()
     venue = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Also bumped whenever the event's nominees or feedback change, so it
+    # versions everything served under the event for conditional GETs.
+    updated_at = models.DateTimeField(auto_now=True)
+    # Set when a DELETE is handed to the ``purge_deleted_events`` worker;
+    # such events are hidden from ``Event.objects`` until they are gone.
+    deleted_at = models.DateTimeField(null=True, blank=True)
+
+    # Denormalized nominee counters, kept in step with F() updates wherever
+    # nominees are added, removed or change status. ``recount_event_stats``
+    # repairs any drift.
+    total_nominees = models.IntegerField(default=0)
+    pending_count = models.IntegerField(default=0)
+    accepted_count = models.IntegerField(default=0)
+    rejected_count = models.IntegerField(default=0)
+    attended_count = models.IntegerField(default=0)
+    feedback_count = models.IntegerField(default=0)
+
+    COUNTER_FIELDS = [
+        "total_nominees",
+        "pending_count",
+        "accepted_count",
+        "rejected_count",
+        "attended_count",
+        "feedback_count",
+    ]
+
+    objects = EventManager()
+    all_objects = EventQuerySet.as_manager()
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="event_created_at_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
 
+class EmployeeQuerySet(models.QuerySet):
+    def unreferenced(self):
+        """Directory rows no nomination points at any more."""
+        return self.filter(nominations__isnull=True)
+
+    def add_missing(self, employees):
+        """Insert the unsaved ``employees`` whose IDs are not in the directory yet.
+
+        Existing rows are left untouched, so a nomination never rewrites
+        someone's directory entry. Run it before saving the nominees, which
+        reference it.
+        """
+        self.bulk_create(employees, ignore_conflicts=True, batch_size=1000)
+
+
+class Employee(models.Model):
+    """One directory row per person, shared by their nominations to every event.
+
+    The only copy of a nominee's name, email and department; cross-event
+    questions go through the indexed ``nominations`` relation instead of
+    string scans.
+    """
+
+    employee_id = models.CharField(max_length=50, primary_key=True)
+    name = models.CharField(max_length=255)
+    email = models.EmailField()
+    department = models.CharField(max_length=255)
+
+    DETAIL_FIELDS = ["name", "email", "department"]
+
+    objects = EmployeeQuerySet.as_manager()
+
+    class Meta:
+        ordering = ["employee_id"]
+        indexes = [
+            models.Index(fields=["department"], name="employee_department_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.employee_id})"
+
+    def differences(self, details):
+        """Return ``{field: current value}`` for ``details`` that disagree.
+
+        Emails are compared case-insensitively.
+        """
+        differ = {}
+        for field, value in details.items():
+            current = getattr(self, field)
+            if field == "email":
+                same = current.lower() == value.lower()
+            else:
+                same = current == value
+            if not same:
+                differ[field] = current
+        return differ
+
+
+class NomineeQuerySet(models.QuerySet):
+    def live(self):
+        """Leave out nominees of events hidden by a background delete."""
+        return self.filter(event__deleted_at__isnull=True)
+
+    def transition(self, event_id, from_status, to_status):
+        """Move this queryset's ``from_status`` nominees of one event to ``to_status``.
+
+        A single conditional UPDATE decides which rows change, so concurrent
+        requests cannot both win; the event counters move by the number of
+        rows actually updated. Returns that number.
+        """
+        with transaction.atomic(savepoint=False):
+            changed = self.filter(event_id=event_id, status=from_status).update(
+                status=to_status, status_changed_at=timezone.now()
+            )
+            if changed:
+                Event.objects.filter(pk=event_id).adjust_counts(
+                    **{
+                        Nominee.COUNT_FIELDS[from_status]: -changed,
+                        Nominee.COUNT_FIELDS[to_status]: changed,
+                    }
+                )
+        return changed
+
+
 class Nominee(models.Model):
 
     STATUS_CHOICES = [
@@ -26,17 +189,39 @@ class Nominee(models.Model):
     ]
 
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="nominees")
-    name = models.CharField(max_length=255)
-    email = models.EmailField()
-    employee_id = models.CharField(max_length=50)
-    department = models.CharField(max_length=255)
+    # The column stays ``employee_id``, so ``nominee.employee_id`` is the ID.
+    # Name, email and department live on the Employee row.
+    employee = models.ForeignKey(
+        Employee, on_delete=models.PROTECT, related_name="nominations"
+    )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="Pending")
+    status_changed_at = models.DateTimeField(null=True, blank=True)
+
+    # Event counter column tracking each status
+    COUNT_FIELDS = {
+        "Pending": "pending_count",
+        "Accepted": "accepted_count",
+        "Rejected": "rejected_count",
+        "Attended": "attended_count",
+    }
+
+    objects = NomineeQuerySet.as_manager()
 
     class Meta:
-        ordering = ["name"]
+        # The (event, employee) index serves event lists and pages in order.
+        ordering = ["employee_id"]
+        indexes = [
+            models.Index(fields=["event", "status"], name="nominee_event_status_idx"),
+            models.Index(
+                fields=["event", "employee"], name="nominee_event_employee_idx"
+            ),
+            models.Index(
+                fields=["-status_changed_at"], name="nominee_status_changed_idx"
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.name} ({self.event.title})"
+        return f"{self.employee.name} ({self.event.title})"
 
 
 class Feedback(models.Model):
@@ -50,4 +235,101 @@ class Feedback(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return f"Feedback from {self.nominee.name}"
+        return f"Feedback from {self.nominee.employee.name}"
+
+
+class OutboxEmail(models.Model):
+    """An email waiting to be delivered by the ``send_outbox`` worker.
+
+    Request handlers only insert rows here; the worker claims due rows by
+    pushing ``next_attempt_at`` forward (a lease), so a crashed worker's
+    rows become due again on their own.
+    """
+
+    STATUS_CHOICES = [
+        ("Pending", "Pending"),
+        ("Sent", "Sent"),
+        ("Failed", "Failed"),
+    ]
+
+    subject = models.CharField(max_length=255)
+    from_email = models.CharField(max_length=255)
+    to = models.EmailField()
+    body = models.TextField()
+    html_body = models.TextField(blank=True, default="")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="Pending")
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["next_attempt_at"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to} ({self.status})"
+
+    @classmethod
+    def from_message(cls, message):
+        """Build an unsaved row for each recipient of an ``EmailMessage``."""
+        html_body = ""
+        for content, mimetype in getattr(message, "alternatives", []):
+            if mimetype == "text/html":
+                html_body = content
+        return [
+            cls(
+                subject=message.subject,
+                from_email=message.from_email,
+                to=recipient,
+                body=message.body,
+                html_body=html_body,
+            )
+            for recipient in message.to
+        ]
+
+    def to_message(self, connection=None):
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=[self.to],
+            connection=connection,
+        )
+        if self.html_body:
+            message.attach_alternative(self.html_body, "text/html")
+        return message
+
+
+class ImportJob(models.Model):
+    """A nominee spreadsheet upload processed by the ``process_imports`` worker."""
+
+    STATUS_CHOICES = [
+        ("Pending", "Pending"),
+        ("Running", "Running"),
+        ("Completed", "Completed"),
+        ("Failed", "Failed"),
+    ]
+
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="import_jobs")
+    file = models.FileField(upload_to="imports/")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="Pending")
+    processed_rows = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    duplicate_count = models.PositiveIntegerField(default=0)
+    invalid_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Renewed by the worker after every chunk; see ``imports.claim_pending_job``.
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Import {self.id} for {self.event.title} ({self.status})"
@@ -0,0 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboxEmail
+from .utils import send_batch
+
+LEASE = timedelta(minutes=5)
+RETRY_BASE_DELAY = timedelta(minutes=1)
+
+
+def enqueue(*messages):
+    """Store messages in the outbox; the ``send_outbox`` worker delivers them."""
+    rows = []
+    for message in messages:
+        rows.extend(OutboxEmail.from_message(message))
+    return OutboxEmail.objects.bulk_create(rows)
+
+
+def claim_due(batch_size):
+    """Lease up to ``batch_size`` due rows so no other worker picks them up."""
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status="Pending", next_attempt_at__lte=now)
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        OutboxEmail.objects.filter(id__in=[row.id for row in rows]).update(
+            attempts=F("attempts") + 1, next_attempt_at=now + LEASE
+        )
+    for row in rows:
+        row.attempts += 1
+    return rows
+
+
+def _send_slice(rows):
+    messages = [row.to_message() for row in rows]
+    return [error for _, error in send_batch(messages, chunk_delay=0)]
+
+
+def deliver(rows, workers, max_attempts):
+    """Send leased rows on a bounded thread pool and record the outcome.
+
+    Each thread sends its share of the rows over one reused SMTP
+    connection, without pausing; callers pace the batches (see
+    ``send_outbox``). Returns ``(sent, retried, failed)`` counts. Threads
+    only talk SMTP; all database writes happen on the calling thread.
+    """
+    slices = [rows[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        slice_errors = list(pool.map(_send_slice, slices))
+    rows = [row for rows_slice in slices for row in rows_slice]
+    errors = [error for errors_slice in slice_errors for error in errors_slice]
+
+    now = timezone.now()
+    sent_ids = [row.id for row, error in zip(rows, errors) if error is None]
+    OutboxEmail.objects.filter(id__in=sent_ids).update(
+        status="Sent", sent_at=now, last_error=""
+    )
+
+    retried = failed = 0
+    for row, error in zip(rows, errors):
+        if error is None:
+            continue
+        if row.attempts >= max_attempts:
+            failed += 1
+            OutboxEmail.objects.filter(id=row.id).update(
+                status="Failed", last_error=error
+            )
+        else:
+            retried += 1
+            delay = RETRY_BASE_DELAY * 2 ** (row.attempts - 1)
+            OutboxEmail.objects.filter(id=row.id).update(
+                last_error=error, next_attempt_at=now + delay
+            )
+    return len(sent_ids), retried, failed
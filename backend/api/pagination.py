@@ -0,0 +1,25 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OptInCursorPagination(CursorPagination):
+    """Keyset pagination that only kicks in when the client asks for it.
+
+    Existing clients get the full list as before; passing ``cursor`` or
+    ``page_size`` switches the response to ``{next, previous, results}``.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+
+class EventCursorPagination(OptInCursorPagination):
+    ordering = "-created_at"
+
+
+class NomineeCursorPagination(OptInCursorPagination):
+    ordering = "employee_id"
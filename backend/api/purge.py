@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Event, Feedback, Nominee
+
+
+def hide_event(event):
+    """Hide ``event`` from ``Event.objects`` and queue it for purging."""
+    Event.all_objects.filter(pk=event.pk).update(deleted_at=timezone.now())
+
+
+def next_hidden_event():
+    """The longest-waiting hidden event, or ``None``."""
+    return (
+        Event.all_objects.filter(deleted_at__isnull=False)
+        .order_by("deleted_at", "id")
+        .only("id", "title")
+        .first()
+    )
+
+
+def _delete_batch(cursor, event_id, batch_size):
+    """Delete up to ``batch_size`` nominees of an event plus their feedback.
+
+    Raw SQL keeps rows out of Python entirely: Django's delete collector
+    would load every nominee and feedback row to cascade them.
+    """
+    quote = connection.ops.quote_name
+    nominees = quote(Nominee._meta.db_table)
+    feedback = quote(Feedback._meta.db_table)
+    nominee_event = quote(Nominee._meta.get_field("event").column)
+    feedback_nominee = quote(Feedback._meta.get_field("nominee").column)
+
+    cursor.execute(
+        f"SELECT id FROM {nominees} WHERE {nominee_event} = %s ORDER BY id LIMIT %s",
+        [event_id, batch_size],
+    )
+    ids = [row[0] for row in cursor.fetchall()]
+    if not ids:
+        return 0
+    placeholders = ", ".join(["%s"] * len(ids))
+    cursor.execute(
+        f"DELETE FROM {feedback} WHERE {feedback_nominee} IN ({placeholders})", ids
+    )
+    cursor.execute(f"DELETE FROM {nominees} WHERE id IN ({placeholders})", ids)
+    return len(ids)
+
+
+def purge_event(event, batch_size=None):
+    """Delete a hidden event's nominees and feedback a batch at a time, then the event.
+
+    Each batch commits on its own, so locks are held only briefly and
+    memory stays flat however large the event is. Safe to re-run after a
+    crash, or from two workers at once: every batch starts from whatever
+    rows are left. Returns the number of nominees deleted.
+    """
+    batch_size = batch_size or settings.EVENT_PURGE_BATCH_SIZE
+    deleted = 0
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            count = _delete_batch(cursor, event.pk, batch_size)
+        if not count:
+            break
+        deleted += count
+
+    # Only the event row, its import jobs and any nominee an in-flight
+    # import added meanwhile are left, so the ORM cascade is cheap now.
+    Event.all_objects.filter(pk=event.pk).delete()
+    return deleted
@@ -0,0 +1,77 @@
+"""Throwaway events with nominees, for the benchmark commands and tests.
+
+The rows are bulk-inserted, so the event's counters are then moved by what
+was added, the same way the API keeps them.
+"""
+from collections import Counter
+from datetime import date, time
+
+from .models import Employee, Event, Feedback, Nominee
+
+
+def create_sample_event(
+    nominees,
+    prefix,
+    statuses=("Pending",),
+    departments=("Benchmark",),
+    name="Nominee {i}",
+    feedback=None,
+    batch_size=None,
+    **event_fields,
+):
+    """An event with ``nominees`` nominees and counters that match them.
+
+    Employee IDs are ``prefix`` plus a running number, so the directory rows
+    can be found again by prefix. Nominee ``i`` gets ``statuses[i % n]`` and
+    likewise a department. ``feedback(nominee_id)``, if given, returns the
+    ``Feedback`` fields for each Attended nominee.
+    """
+    event = Event.objects.create(
+        **{
+            "title": "Benchmark event",
+            "description": "",
+            "date": date.today(),
+            "time": time(9, 0),
+            "venue": "Benchmark",
+            **event_fields,
+        }
+    )
+    employees = [
+        Employee(
+            employee_id=f"{prefix}{i:06d}",
+            name=name.format(i=i),
+            email=f"nominee{i}@example.com",
+            department=departments[i % len(departments)],
+        )
+        for i in range(nominees)
+    ]
+    Employee.objects.add_missing(employees)
+    Nominee.objects.bulk_create(
+        (
+            Nominee(event=event, employee=employee, status=statuses[i % len(statuses)])
+            for i, employee in enumerate(employees)
+        ),
+        batch_size=batch_size,
+    )
+    counts = Counter(statuses[i % len(statuses)] for i in range(nominees))
+    deltas = {Nominee.COUNT_FIELDS[status]: count for status, count in counts.items()}
+
+    if feedback is not None:
+        # MySQL does not return ids from bulk_create, so look them up.
+        attended = event.nominees.filter(status="Attended").values_list("id", flat=True)
+        rows = Feedback.objects.bulk_create(
+            (Feedback(nominee_id=pk, **feedback(pk)) for pk in list(attended)),
+            batch_size=batch_size,
+        )
+        deltas["feedback_count"] = len(rows)
+
+    Event.objects.filter(pk=event.pk).adjust_counts(total_nominees=nominees, **deltas)
+    event.refresh_from_db()
+    return event
+
+
+def delete_sample_event(event, prefix):
+    """Remove ``event`` and the directory rows created for it under ``prefix``."""
+    event.delete()
+    # Every ID with this prefix was created for the sample event.
+    Employee.objects.filter(employee_id__startswith=prefix).delete()
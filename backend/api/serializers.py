@@ -1,5 +1,20 @@
 from rest_framework import serializers
-from .models import Event, Nominee, Feedback
+from .models import Employee, Event, Nominee, Feedback, ImportJob
+
+
+class SparseFieldsMixin:
+    """Limit output to the field names passed as ``fields=[...]``.
+
+    Unknown names are ignored so clients can share one ``fields`` list
+    across endpoints.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
 
 class FeedbackSerializer(serializers.ModelSerializer):
@@ -9,7 +24,58 @@ class FeedbackSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "submitted_at"]
 
 
-class NomineeSerializer(serializers.ModelSerializer):
+class EmployeeDetailsSerializer(serializers.Serializer):
+    """Name, email and department, read from the nominee's Employee row.
+
+    A new nomination adds the employee to the directory when they are
+    missing from it; rows for someone already in it must carry the same
+    details (see ``directory_errors``).
+    """
+
+    name = serializers.CharField(source="employee.name", max_length=255)
+    email = serializers.EmailField(source="employee.email")
+    department = serializers.CharField(source="employee.department", max_length=255)
+    # The Employee foreign key's raw value.
+    employee_id = serializers.CharField(max_length=50)
+
+    def validate(self, attrs):
+        employee_id = attrs.get("employee_id")
+        details = attrs.get("employee", {})
+        if (
+            employee_id
+            and len(details) < len(Employee.DETAIL_FIELDS)
+            and not Employee.objects.filter(pk=employee_id).exists()
+        ):
+            raise serializers.ValidationError(
+                {
+                    "employee_id": "Unknown employee; send their name, email "
+                    "and department too."
+                }
+            )
+        return attrs
+
+    @staticmethod
+    def employee(values):
+        """The unsaved Employee row described by validated ``values``."""
+        return Employee(employee_id=values["employee_id"], **values.get("employee", {}))
+
+    @staticmethod
+    def directory_errors(employee, details):
+        """Errors for the ``details`` that differ from ``employee``'s entry."""
+        return {
+            field: [
+                f"The directory has {current!r} for {employee.employee_id}; "
+                "send that or update the entry first."
+            ]
+            for field, current in employee.differences(details).items()
+        }
+
+
+class NomineeSerializer(
+    EmployeeDetailsSerializer, SparseFieldsMixin, serializers.ModelSerializer
+):
+    """A nomination; updating its details updates the employee's entry."""
+
     feedback = FeedbackSerializer(read_only=True)
 
     class Meta:
@@ -26,14 +92,43 @@ class NomineeSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "status"]
 
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if self.instance is None:
+            employee = Employee.objects.filter(pk=attrs["employee_id"]).first()
+            if employee is not None:
+                errors = self.directory_errors(employee, attrs["employee"])
+                if errors:
+                    raise serializers.ValidationError(errors)
+        return attrs
+
+    def create(self, validated_data):
+        Employee.objects.add_missing([self.employee(validated_data)])
+        validated_data.pop("employee", None)
+        return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        if "employee_id" in validated_data:
+            Employee.objects.add_missing([self.employee(validated_data)])
+        details = validated_data.pop("employee", {})
+        nominee = super().update(instance, validated_data)
+        if details:
+            Employee.objects.filter(pk=nominee.employee_id).update(**details)
+            for field, value in details.items():
+                setattr(nominee.employee, field, value)
+        return nominee
+
+
+class NomineeImportSerializer(EmployeeDetailsSerializer, serializers.ModelSerializer):
+    """Validates one row of a bulk nominee import."""
 
-class EventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Nominee
+        fields = ["name", "email", "employee_id", "department"]
+
+
+class EventSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     nominees = NomineeSerializer(many=True, read_only=True)
-    total_nominees = serializers.SerializerMethodField()
-    accepted_count = serializers.SerializerMethodField()
-    rejected_count = serializers.SerializerMethodField()
-    pending_count = serializers.SerializerMethodField()
-    attended_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Event
@@ -51,33 +146,21 @@ class EventSerializer(serializers.ModelSerializer):
             "rejected_count",
             "pending_count",
             "attended_count",
+            "feedback_count",
+        ]
+        read_only_fields = [
+            "id",
+            "created_at",
+            "total_nominees",
+            "accepted_count",
+            "rejected_count",
+            "pending_count",
+            "attended_count",
+            "feedback_count",
         ]
-        read_only_fields = ["id", "created_at"]
-
-    def get_total_nominees(self, obj):
-        return obj.nominees.count()
-
-    def get_accepted_count(self, obj):
-        return obj.nominees.filter(status="Accepted").count()
-
-    def get_rejected_count(self, obj):
-        return obj.nominees.filter(status="Rejected").count()
-
-    def get_pending_count(self, obj):
-        return obj.nominees.filter(status="Pending").count()
-
-    def get_attended_count(self, obj):
-        return obj.nominees.filter(status="Attended").count()
-
-
-class EventListSerializer(serializers.ModelSerializer):
 
-    total_nominees = serializers.SerializerMethodField()
-    accepted_count = serializers.SerializerMethodField()
-    rejected_count = serializers.SerializerMethodField()
-    pending_count = serializers.SerializerMethodField()
-    attended_count = serializers.SerializerMethodField()
 
+class EventListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = [
@@ -93,20 +176,34 @@ class EventListSerializer(serializers.ModelSerializer):
             "rejected_count",
             "pending_count",
             "attended_count",
+            "feedback_count",
+        ]
+        read_only_fields = [
+            "id",
+            "created_at",
+            "total_nominees",
+            "accepted_count",
+            "rejected_count",
+            "pending_count",
+            "attended_count",
+            "feedback_count",
         ]
-        read_only_fields = ["id", "created_at"]
-
-    def get_total_nominees(self, obj):
-        return obj.nominees.count()
-
-    def get_accepted_count(self, obj):
-        return obj.nominees.filter(status="Accepted").count()
-
-    def get_rejected_count(self, obj):
-        return obj.nominees.filter(status="Rejected").count()
 
-    def get_pending_count(self, obj):
-        return obj.nominees.filter(status="Pending").count()
 
-    def get_attended_count(self, obj):
-        return obj.nominees.filter(status="Attended").count()
+class ImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ImportJob
+        fields = [
+            "id",
+            "event",
+            "status",
+            "processed_rows",
+            "created_count",
+            "duplicate_count",
+            "invalid_count",
+            "errors",
+            "error",
+            "created_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
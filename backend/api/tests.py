@@ -0,0 +1,287 @@
+import os
+import shutil
+import tempfile
+from datetime import date
+from io import StringIO
+from unittest import mock
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.files.base import ContentFile
+from django.core.mail import EmailMessage
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .metrics import observe_email, registry, serve_metrics
+from .models import Employee, Event, ImportJob, Nominee, OutboxEmail
+from .outbox import enqueue
+from .sample_events import create_sample_event
+
+
+def create_event(title="Event", nominees=0):
+    """An event with ``nominees`` pending nominees and matching counters."""
+    return create_sample_event(
+        nominees,
+        prefix=title.upper(),
+        departments=("Engineering",),
+        title=title,
+        date=date(2030, 1, 1),
+        venue="Room 1",
+    )
+
+
+class EventListQueryCountTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_user("admin", password="admin"))
+
+    def test_query_count_does_not_grow_with_events(self):
+        create_event("First", nominees=3)
+        with CaptureQueriesContext(connection) as one_event:
+            response = self.client.get("/api/events/")
+        self.assertEqual(len(response.json()), 1)
+
+        for i in range(10):
+            create_event(f"More{i}", nominees=i)
+        with self.assertNumQueries(len(one_event)):
+            response = self.client.get("/api/events/")
+        self.assertEqual(len(response.json()), 11)
+
+
+class RecountEventStatsTests(TestCase):
+    def test_repair_recounts_and_bumps_updated_at(self):
+        event = create_event("Drift", nominees=3)
+        stale = timezone.now() - timezone.timedelta(days=1)
+        # Change a status behind the counters' back.
+        Nominee.objects.filter(pk=event.nominees.first().pk).update(status="Accepted")
+        Event.objects.filter(pk=event.pk).update(updated_at=stale)
+
+        out = StringIO()
+        call_command("recount_event_stats", stdout=out)
+
+        self.assertIn("repaired 1", out.getvalue())
+        event.refresh_from_db()
+        self.assertEqual(
+            [getattr(event, field) for field in Event.COUNTER_FIELDS], [3, 2, 1, 0, 0, 0]
+        )
+        self.assertGreater(event.updated_at, stale)
+
+    def test_sample_events_need_no_repair(self):
+        create_sample_event(
+            8,
+            "SAMPLE",
+            statuses=("Pending", "Accepted", "Rejected", "Attended"),
+            feedback=lambda nominee_id: {"rating": 4},
+        )
+
+        out = StringIO()
+        call_command("recount_event_stats", stdout=out)
+
+        self.assertIn("repaired 0", out.getvalue())
+
+
+class EmployeeDirectoryTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_user("admin", password="admin"))
+
+    def directory(self):
+        return Employee.objects.values_list("name", "email", "department").get()
+
+    def test_nominating_with_other_details_is_reported(self):
+        event = create_event("Directory", nominees=1)
+        response = self.client.post(
+            f"/api/events/{event.pk}/nominees/",
+            {
+                "name": "Nominee 0",
+                "email": "old@example.com",
+                "employee_id": "DIRECTORY000000",
+                "department": "Engineering",
+            },
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.json()["errors"][0]), ["email"])
+        self.assertEqual(Nominee.objects.count(), 1)
+        self.assertFalse(OutboxEmail.objects.exists())
+        self.assertEqual(
+            self.directory(),
+            ("Nominee 0", "nominee0@example.com", "Engineering"),
+        )
+
+    def test_put_updates_the_directory_entry(self):
+        nominee = Nominee.objects.get(event=create_event("Directory", nominees=1))
+        response = self.client.put(
+            f"/api/nominees/{nominee.pk}/",
+            {"email": "new@example.com", "department": "Sales"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            (response.json()["email"], response.json()["department"]),
+            ("new@example.com", "Sales"),
+        )
+        self.assertEqual(self.directory(), ("Nominee 0", "new@example.com", "Sales"))
+
+
+class HotQueryIndexTests(TransactionTestCase):
+    """Runs ``explain_hot_queries --check``, the check CI would otherwise skip."""
+
+    def explain(self, event):
+        call_command(
+            "explain_hot_queries",
+            f"--event-id={event.pk}",
+            "--check",
+            stdout=StringIO(),
+        )
+
+    def test_hot_queries_use_their_indexes(self):
+        self.explain(create_event("Indexed", nominees=20))
+
+    def test_check_fails_without_the_index(self):
+        event = create_event("Unindexed", nominees=20)
+        index = next(
+            index
+            for index in Nominee._meta.indexes
+            if index.name == "nominee_event_status_idx"
+        )
+        with connection.schema_editor() as editor:
+            editor.remove_index(Nominee, index)
+        try:
+            with self.assertRaisesMessage(CommandError, "Nominees of an event by status"):
+                self.explain(event)
+        finally:
+            with connection.schema_editor() as editor:
+                editor.add_index(Nominee, index)
+
+
+@override_settings(EMAIL_BATCH_DELAY=0)
+class OutboxTests(TestCase):
+    def send_outbox(self):
+        call_command("send_outbox", "--once", stdout=StringIO())
+
+    def test_send_outbox_drains_the_outbox(self):
+        enqueue(
+            EmailMessage("Invitation", "Hello", "admin@example.com", ["a@example.com"]),
+            EmailMessage("Invitation", "Hello", "admin@example.com", ["b@example.com"]),
+        )
+        self.send_outbox()
+
+        self.assertFalse(OutboxEmail.objects.filter(status="Pending").exists())
+        self.assertEqual(OutboxEmail.objects.filter(status="Sent").count(), 2)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            ["a@example.com", "b@example.com"],
+        )
+
+    @override_settings(EMAIL_BATCH_SIZE=2, EMAIL_BATCH_DELAY=1)
+    def test_batches_are_paced_across_workers(self):
+        enqueue(
+            *(
+                EmailMessage("Invitation", "Hello", "admin@example.com", [f"{i}@x.com"])
+                for i in range(5)
+            )
+        )
+        sent_before_pause = []
+
+        def sleep(seconds):
+            self.assertGreater(seconds, 0.5)
+            sent_before_pause.append(len(mail.outbox))
+
+        with mock.patch("api.management.commands.send_outbox.time.sleep", sleep):
+            call_command("send_outbox", "--once", "--workers=4", stdout=StringIO())
+
+        # Batches of at most two, with a pause before each claim after the first.
+        self.assertEqual(sent_before_pause, [2, 4, 5])
+
+    def test_failed_send_is_retried(self):
+        enqueue(
+            EmailMessage("Invitation", "Hello", "admin@example.com", ["a@example.com"])
+        )
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=ConnectionError("connection reset"),
+        ):
+            self.send_outbox()
+
+        row = OutboxEmail.objects.get()
+        self.assertEqual(row.status, "Pending")
+        self.assertEqual(row.attempts, 1)
+        self.assertEqual(row.last_error, "connection reset")
+        self.assertGreater(row.next_attempt_at, timezone.now())
+        self.assertEqual(mail.outbox, [])
+
+        # Not due yet: a second run leaves it alone.
+        self.send_outbox()
+        self.assertEqual(mail.outbox, [])
+
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+        self.send_outbox()
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts, row.last_error), ("Sent", 2, ""))
+        self.assertEqual(len(mail.outbox), 1)
+
+
+class ImportJobTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_failure_part_way_through_is_recorded(self):
+        event = create_event("Import")
+        # The second chunk hits bytes that are not UTF-8.
+        lines = [b"Name,Email,Employee ID,Department"] + [
+            f"Person {i},person{i}@example.com,IMP{i:05d},HR".encode()
+            for i in range(1500)
+        ]
+        lines.append(b"Bad \xff\xfe,bad@example.com,IMPBAD,HR")
+        job = ImportJob.objects.create(
+            event=event, file=ContentFile(b"\n".join(lines), name="nominees.csv")
+        )
+        path = job.file.path
+
+        call_command("process_imports", "--once", stdout=StringIO())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "Failed")
+        self.assertIn("utf-8", job.error)
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual((job.processed_rows, job.created_count), (1000, 1000))
+        self.assertEqual(Nominee.objects.filter(event=event).count(), 1000)
+        self.assertFalse(job.file)
+        self.assertFalse(os.path.exists(path))
+
+
+@override_settings(REQUEST_METRICS_ENABLED=True, METRICS_TOKEN="secret")
+class WorkerMetricsTests(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.addCleanup(registry.reset)
+        server = serve_metrics(0, host="127.0.0.1")
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+
+    def scrape(self, token):
+        request = Request(self.url, headers={"Authorization": f"Bearer {token}"})
+        with urlopen(request, timeout=5) as response:
+            return response.read().decode()
+
+    def test_worker_serves_email_send_time(self):
+        observe_email(0.2, ok=True)
+        self.assertIn(
+            'email_send_seconds_count{outcome="sent"} 1', self.scrape("secret")
+        )
+
+    def test_worker_scrape_needs_the_token(self):
+        with self.assertRaises(HTTPError) as raised:
+            self.scrape("wrong")
+        self.assertEqual(raised.exception.code, 401)
@@ -1,5 +1,13 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import live, views
+
+# The public links and feedback form take traffic spikes after email blasts;
+# ASGI deployments can serve them from the async view module instead.
+if settings.ASYNC_PUBLIC_VIEWS:
+    from . import async_views as public_views
+else:
+    public_views = views
 
 urlpatterns = [
     # Authentication
@@ -9,18 +17,55 @@ urlpatterns = [
     # Events
     path("events/", views.event_list_create, name="event-list-create"),
     path("events/<int:pk>/", views.event_detail, name="event-detail"),
+    path("events/stats-cache/", views.event_stats_cache, name="event-stats-cache"),
+    # Live updates (Server-Sent Events, ASGI only)
+    path("live/", live.event_stream, name="live-updates"),
+    path("events/<int:event_id>/live/", live.event_stream, name="event-live-updates"),
+    # Dashboard
+    path("dashboard/summary/", views.dashboard_summary, name="dashboard-summary"),
+    # Employee directory
+    path(
+        "employees/<str:employee_id>/",
+        views.employee_detail,
+        name="employee-detail",
+    ),
+    path("departments/", views.department_rollups, name="department-rollups"),
     # Nominees
     path(
         "events/<int:event_id>/nominees/",
         views.nominee_list_create,
         name="nominee-list-create",
     ),
+    path(
+        "events/<int:event_id>/nominees/import/",
+        views.nominee_bulk_import,
+        name="nominee-bulk-import",
+    ),
+    path(
+        "events/<int:event_id>/nominees/upload/",
+        views.nominee_upload,
+        name="nominee-upload",
+    ),
+    path("imports/<int:pk>/", views.import_job_detail, name="import-job-detail"),
     path("nominees/<int:pk>/", views.nominee_detail, name="nominee-detail"),
     # Accept / Reject (public links)
-    path("nominee/<int:pk>/accept/", views.nominee_accept, name="nominee-accept"),
-    path("nominee/<int:pk>/reject/", views.nominee_reject, name="nominee-reject"),
+    path(
+        "nominee/<int:pk>/accept/",
+        public_views.nominee_accept,
+        name="nominee-accept",
+    ),
+    path(
+        "nominee/<int:pk>/reject/",
+        public_views.nominee_reject,
+        name="nominee-reject",
+    ),
     # Attendance
     path("nominee/<int:pk>/attend/", views.mark_attendance, name="mark-attendance"),
+    path(
+        "events/<int:event_id>/attendance/",
+        views.bulk_mark_attendance,
+        name="bulk-mark-attendance",
+    ),
     # Feedback emails
     path(
         "events/<int:event_id>/send-feedback/",
@@ -28,14 +73,31 @@ urlpatterns = [
         name="send-feedback-emails",
     ),
     # Feedback (public + admin)
-    path("feedback/<int:nominee_id>/", views.submit_feedback, name="submit-feedback"),
     path(
-        "feedback/<int:nominee_id>/info/", views.get_nominee_info, name="nominee-info"
+        "feedback/<int:nominee_id>/",
+        public_views.submit_feedback,
+        name="submit-feedback",
+    ),
+    path(
+        "feedback/<int:nominee_id>/info/",
+        public_views.get_nominee_info,
+        name="nominee-info",
     ),
     path("event/<int:event_id>/feedback/", views.event_feedback, name="event-feedback"),
+    path(
+        "event/<int:event_id>/feedback/analytics/",
+        views.event_feedback_analytics,
+        name="event-feedback-analytics",
+    ),
+    path("feedback/analytics/", views.feedback_trend, name="feedback-trend"),
     path(
         "event/<int:event_id>/feedback/download/",
         views.download_feedback_csv,
         name="download-feedback-csv",
     ),
+    path(
+        "feedback/download/",
+        views.download_all_feedback_csv,
+        name="download-all-feedback-csv",
+    ),
 ]
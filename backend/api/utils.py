@@ -1,191 +1,171 @@
-from django.core.mail import EmailMultiAlternatives
-from django.conf import settings
-
-
-def send_invitation_email(nominee):
-    """Send invitation email to a nominee with Accept/Reject links."""
-    event = nominee.event
-    accept_url = f"{settings.BACKEND_URL}/api/nominee/{nominee.id}/accept/"
-    reject_url = f"{settings.BACKEND_URL}/api/nominee/{nominee.id}/reject/"
-
-    subject = f"Invitation: {event.title}"
-    text_message = f"""
-Dear {nominee.name},
-
-You have been nominated for the following training event:
-
-Event: {event.title}
-Description: {event.description}
-Date: {event.date.strftime('%B %d, %Y')}
-Time: {event.time.strftime('%I:%M %p')}
-Venue: {event.venue}
-
-Please respond to this invitation by clicking one of the links below:
-
-Accept: {accept_url}
-Reject: {reject_url}
-
-Best regards,
-Training Management Team
-"""
-
-    html_message = f"""
-<html>
-<body>
-<p>Dear {nominee.name},</p>
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
 
-<p>You have been nominated for the following training event:</p>
-
-<ul>
-<li><strong>Event:</strong> {event.title}</li>
-<li><strong>Description:</strong> {event.description}</li>
-<li><strong>Date:</strong> {event.date.strftime('%B %d, %Y')}</li>
-<li><strong>Time:</strong> {event.time.strftime('%I:%M %p')}</li>
-<li><strong>Venue:</strong> {event.venue}</li>
-</ul>
-
-<p>Please respond to this invitation by clicking one of the links below:</p>
-
-<p><a href="{accept_url}" style="background-color: #28a745; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Accept</a></p>
-<p><a href="{reject_url}" style="background-color: #dc3545; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Reject</a></p>
-
-<p>Best regards,<br>Training Management Team</p>
-</body>
-</html>
-"""
-
-    try:
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.conf import settings
+from django.template.loader import get_template
+from django.utils.html import escape
+
+from .metrics import observe_email
+
+
+def _error_text(e):
+    return str(e) or e.__class__.__name__
+
+
+def send_batch(messages, chunk_size=None, chunk_delay=None):
+    """Send messages reusing one SMTP connection per chunk.
+
+    Chunks default to ``EMAIL_BATCH_SIZE`` messages with ``EMAIL_BATCH_DELAY``
+    seconds between them to stay under provider rate limits. Returns a list
+    of ``(message, error)`` pairs where ``error`` is ``None`` on success.
+    """
+    chunk_size = chunk_size or settings.EMAIL_BATCH_SIZE
+    if chunk_delay is None:
+        chunk_delay = settings.EMAIL_BATCH_DELAY
+
+    results = []
+    for start in range(0, len(messages), chunk_size):
+        if start and chunk_delay:
+            time.sleep(chunk_delay)
+        chunk = messages[start : start + chunk_size]
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            results.extend((message, _error_text(e)) for message in chunk)
+            continue
+        try:
+            for message in chunk:
+                started = time.perf_counter()
+                try:
+                    connection.send_messages([message])
+                except Exception as e:
+                    observe_email(time.perf_counter() - started, ok=False)
+                    results.append((message, _error_text(e)))
+                    # The server may have dropped us; start the rest afresh.
+                    connection.close()
+                    try:
+                        connection.open()
+                    except Exception:
+                        pass
+                else:
+                    observe_email(time.perf_counter() - started, ok=True)
+                    results.append((message, None))
+        finally:
+            connection.close()
+    return results
+
+
+# Marks the per-recipient slots left in a campaign's pre-rendered bodies.
+# Neither autoescaping nor any email text produces this control character.
+SLOT = "\x1f"
+
+
+@lru_cache(maxsize=None)
+def _template(name):
+    return get_template(name)
+
+
+def _render_parts(name, context, fields):
+    """Render a template once, leaving ``fields`` as slots to fill later.
+
+    Returns the rendered text split on the slots: even items are literal
+    text, odd items are field names.
+    """
+    slots = {field: f"{SLOT}{field}{SLOT}" for field in fields}
+    return _template(name).render({**context, **slots}).split(SLOT)
+
+
+def _fill(parts, values, html):
+    out = list(parts)
+    for i in range(1, len(out), 2):
+        value = values[out[i]]
+        out[i] = escape(value) if html else value
+    return "".join(out)
+
+
+class EmailCampaign(ABC):
+    """One email sent to many nominees of the same event.
+
+    The ``emails/<template>.txt`` and ``.html`` bodies are rendered once
+    with the event; each message then only fills in the ``fields`` that
+    ``recipient_values()`` returns for its nominee.
+    """
+
+    template = None
+    subject = None
+    fields = ()
+
+    def __init__(self, event):
+        name = f"emails/{self.template}"
+        context = {"event": event}
+        self.subject = self.subject.format(event=event)
+        self.text_parts = _render_parts(f"{name}.txt", context, self.fields)
+        self.html_parts = _render_parts(f"{name}.html", context, self.fields)
+
+    @staticmethod
+    @abstractmethod
+    def recipient_values(nominee):
+        """Return ``{field: value}`` for each of ``fields``."""
+
+    def message(self, nominee):
+        values = self.recipient_values(nominee)
         email = EmailMultiAlternatives(
-            subject=subject,
-            body=text_message,
+            subject=self.subject,
+            body=_fill(self.text_parts, values, html=False),
             from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[nominee.email],
+            to=[nominee.employee.email],
         )
-        email.attach_alternative(html_message, "text/html")
-        email.send(fail_silently=False)
-        return True
-    except Exception as e:
-        print(f"Failed to send invitation email to {nominee.email}: {e}")
-        return False
-
-
-def send_status_notification_to_admin(nominee, status):
-    """Notify admin when a nominee accepts or rejects an invitation."""
-    event = nominee.event
-    subject = f"Nominee {status}: {nominee.name} — {event.title}"
-    text_message = f"""
-Hello Admin,
-
-Nominee "{nominee.name}" has {status.lower()} the invitation for the training event:
-
-Event: {event.title}
-Nominee: {nominee.name}
-Email: {nominee.email}
-Department: {nominee.department}
-Status: {status}
-
-Please check the dashboard for updated counts.
-
-Best regards,
-Training Management System
-"""
-
-    html_message = f"""
-<html>
-<body>
-<p>Hello Admin,</p>
-
-<p>Nominee "<strong>{nominee.name}</strong>" has {status.lower()} the invitation for the training event:</p>
-
-<ul>
-<li><strong>Event:</strong> {event.title}</li>
-<li><strong>Nominee:</strong> {nominee.name}</li>
-<li><strong>Email:</strong> {nominee.email}</li>
-<li><strong>Department:</strong> {nominee.department}</li>
-<li><strong>Status:</strong> {status}</li>
-</ul>
-
-<p>Please check the dashboard for updated counts.</p>
-
-<p>Best regards,<br>Training Management System</p>
-</body>
-</html>
-"""
-
-    try:
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[settings.ADMIN_EMAIL],
+        email.attach_alternative(
+            _fill(self.html_parts, values, html=True), "text/html"
         )
-        email.attach_alternative(html_message, "text/html")
-        email.send(fail_silently=False)
-        return True
-    except Exception as e:
-        print(f"Failed to send admin notification: {e}")
-        return False
-
+        return email
 
-def send_feedback_email(nominee):
-    """Send feedback form link to an attended nominee."""
-    event = nominee.event
-    feedback_url = f"{settings.FRONTEND_URL}/feedback/{nominee.id}"
-
-    subject = f"Feedback Request: {event.title}"
-    text_message = f"""
-Dear {nominee.name},
-
-Thank you for attending the training event:
-
-Event: {event.title}
-Date: {event.date.strftime('%B %d, %Y')}
-Venue: {event.venue}
-
-We value your feedback! Please take a moment to share your experience by clicking the link below:
-
-Feedback Form: {feedback_url}
 
-Your feedback helps us improve future training programs.
+class InvitationCampaign(EmailCampaign):
+    """Invitations with Accept/Reject links."""
 
-Best regards,
-Training Management Team
-"""
+    template = "invitation"
+    subject = "Invitation: {event.title}"
+    fields = ("name", "accept_url", "reject_url")
 
-    html_message = f"""
-<html>
-<body>
-<p>Dear {nominee.name},</p>
+    @staticmethod
+    def recipient_values(nominee):
+        return {
+            "name": nominee.employee.name,
+            "accept_url": f"{settings.BACKEND_URL}/api/nominee/{nominee.id}/accept/",
+            "reject_url": f"{settings.BACKEND_URL}/api/nominee/{nominee.id}/reject/",
+        }
 
-<p>Thank you for attending the training event:</p>
 
-<ul>
-<li><strong>Event:</strong> {event.title}</li>
-<li><strong>Date:</strong> {event.date.strftime('%B %d, %Y')}</li>
-<li><strong>Venue:</strong> {event.venue}</li>
-</ul>
+class FeedbackCampaign(EmailCampaign):
+    """Feedback form link emails for attended nominees."""
 
-<p>We value your feedback! Please take a moment to share your experience by clicking the link below:</p>
+    template = "feedback_request"
+    subject = "Feedback Request: {event.title}"
+    fields = ("name", "feedback_url")
 
-<p><a href="{feedback_url}" style="background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Click Here to Fill Feedback</a></p>
+    @staticmethod
+    def recipient_values(nominee):
+        return {
+            "name": nominee.employee.name,
+            "feedback_url": f"{settings.FRONTEND_URL}/feedback/{nominee.id}",
+        }
 
-<p>Your feedback helps us improve future training programs.</p>
 
-<p>Best regards,<br>Training Management Team</p>
-</body>
-</html>
-"""
-
-    try:
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[nominee.email],
-        )
-        email.attach_alternative(html_message, "text/html")
-        email.send(fail_silently=False)
-        return True
-    except Exception as e:
-        print(f"Failed to send feedback email to {nominee.email}: {e}")
-        return False
+def build_status_notification_to_admin(nominee, status):
+    """Build the admin notification for a nominee accepting or rejecting."""
+    event = nominee.event
+    context = {"nominee": nominee, "event": event, "status": status}
+    email = EmailMultiAlternatives(
+        subject=f"Nominee {status}: {nominee.employee.name} — {event.title}",
+        body=_template("emails/status_notification.txt").render(context),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[settings.ADMIN_EMAIL],
+    )
+    email.attach_alternative(
+        _template("emails/status_notification.html").render(context), "text/html"
+    )
+    return email
@@ -1,5 +1,6 @@
-import csv
-from django.http import HttpResponse, HttpResponseRedirect
+from django.db import transaction
+from django.http import HttpResponseRedirect, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
 from django.contrib.auth import authenticate, login, logout
 from django.conf import settings
 from rest_framework import status
@@ -7,20 +8,72 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 
-from .models import Event, Nominee, Feedback
+from .analytics import cache_counters, get_event_analytics, get_trend
+from .attendance import ID_FIELDS, ids_from_csv, mark_attended
+from .conditional import conditional_get, event_list_version, event_version
+from .dashboard import get_summary
+from .employees import employee_history, get_department_rollups
+from .exports import feedback_csv, gzip_csv
+from .fastjson import FastJSONResponse, event_feedback_list, nominee_list
+from .filters import filter_events, filter_nominees
+from .imports import SPREADSHEET_EXTENSIONS, import_nominees, summarize
+from .live import publish_feedback, publish_status_change
+from .models import Employee, Event, Nominee, Feedback, ImportJob
+from .outbox import enqueue
+from .pagination import EventCursorPagination, NomineeCursorPagination
+from .purge import hide_event
 from .serializers import (
     EventSerializer,
     EventListSerializer,
     NomineeSerializer,
     FeedbackSerializer,
+    ImportJobSerializer,
 )
 from .utils import (
-    send_invitation_email,
-    send_status_notification_to_admin,
-    send_feedback_email,
+    FeedbackCampaign,
+    InvitationCampaign,
+    build_status_notification_to_admin,
 )
 
 
+def _requested_fields(request):
+    """Parse the optional ``fields=a,b,c`` sparse-fieldset query param."""
+    fields = request.query_params.get("fields")
+    if not fields:
+        return None
+    return [name.strip() for name in fields.split(",") if name.strip()]
+
+
+def _wants_fast_json(request):
+    """Whether the plain JSON renderer was negotiated (not the browsable API)."""
+    return request.accepted_renderer.format == "json"
+
+
+def _list_response(request, queryset, serializer_class, paginator, fast_rows=None):
+    """Serialize a list, paginating only when the client asked for a page.
+
+    Unpaginated JSON lists go through ``fast_rows(queryset, fields)`` when
+    given, which builds the same payload from ``values_list()`` rows.
+    """
+    fields = _requested_fields(request)
+    paginated = paginator.is_requested(request)
+    if fast_rows is not None and not paginated and _wants_fast_json(request):
+        return FastJSONResponse(fast_rows(queryset, fields))
+    rows = paginator.paginate_queryset(queryset, request) if paginated else queryset
+    serializer = serializer_class(rows, many=True, fields=fields)
+    if paginated:
+        return paginator.get_paginated_response(serializer.data)
+    return Response(serializer.data)
+
+
+def _nominee_counts(nominee, sign=1):
+    """The event counter deltas contributed by one nominee."""
+    deltas = {"total_nominees": sign, Nominee.COUNT_FIELDS[nominee.status]: sign}
+    if Feedback.objects.filter(nominee=nominee).exists():
+        deltas["feedback_count"] = sign
+    return deltas
+
+
 # ─── Authentication ──────────────────────────────────────────────────
 
 
@@ -66,14 +119,20 @@ def check_auth(request):
 # ─── Events ──────────────────────────────────────────────────────────
 
 
+@conditional_get(event_list_version)
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def event_list_create(request):
-    """List all events or create a new event."""
+    """List all events or create a new event.
+
+    GET accepts ``date_from`` / ``date_to`` filters, ``fields`` and the
+    optional ``cursor`` / ``page_size`` pagination params.
+    """
     if request.method == "GET":
-        events = Event.objects.all()
-        serializer = EventListSerializer(events, many=True)
-        return Response(serializer.data)
+        events = filter_events(Event.objects.all(), request.query_params)
+        return _list_response(
+            request, events, EventListSerializer, EventCursorPagination()
+        )
 
     elif request.method == "POST":
         serializer = EventSerializer(data=request.data)
@@ -83,17 +142,27 @@ def event_list_create(request):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@conditional_get(event_version)
 @api_view(["GET", "PUT", "DELETE"])
 @permission_classes([IsAuthenticated])
 def event_detail(request, pk):
-    """Get, update, or delete a specific event."""
+    """Get, update, or delete a specific event.
+
+    DELETE answers 204 once the event is gone, or 202 for events with more
+    than ``EVENT_INLINE_DELETE_LIMIT`` nominees, which are hidden at once
+    and removed by the ``purge_deleted_events`` worker.
+    """
+    fields = _requested_fields(request)
+    events = Event.objects.all()
+    if request.method == "GET" and (fields is None or "nominees" in fields):
+        events = events.with_nominees()
     try:
-        event = Event.objects.get(pk=pk)
+        event = events.get(pk=pk)
     except Event.DoesNotExist:
         return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
 
     if request.method == "GET":
-        serializer = EventSerializer(event)
+        serializer = EventSerializer(event, fields=fields)
         return Response(serializer.data)
 
     elif request.method == "PUT":
@@ -104,28 +173,92 @@ def event_detail(request, pk):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     elif request.method == "DELETE":
+        # Cascading tens of thousands of nominees inline can time out, so
+        # large events are hidden now and purged by purge_deleted_events.
+        if event.total_nominees > settings.EVENT_INLINE_DELETE_LIMIT:
+            hide_event(event)
+            return Response(
+                {"message": "Event scheduled for deletion."},
+                status=status.HTTP_202_ACCEPTED,
+            )
         event.delete()
         return Response(
             {"message": "Event deleted."}, status=status.HTTP_204_NO_CONTENT
         )
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def event_stats_cache(request):
+    """Hit/miss counters for the per-event feedback analytics cache."""
+    return Response(cache_counters())
+
+
+# ─── Dashboard ───────────────────────────────────────────────────────
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def dashboard_summary(request):
+    """Per-event counts, totals, upcoming events and recent responses."""
+    return Response(get_summary())
+
+
+# ─── Employees ────────────────────────────────────────────────────────
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def employee_detail(request, employee_id):
+    """An employee's directory entry and every training they were nominated to."""
+    try:
+        employee = Employee.objects.get(pk=employee_id)
+    except Employee.DoesNotExist:
+        return Response(
+            {"error": "Employee not found."}, status=status.HTTP_404_NOT_FOUND
+        )
+    return Response(employee_history(employee))
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def department_rollups(request):
+    """Nomination, attendance and feedback totals per department.
+
+    ``department`` limits the result to one department.
+    """
+    return Response(get_department_rollups(request.query_params.get("department")))
+
+
 # ─── Nominees ─────────────────────────────────────────────────────────
 
 
+@conditional_get(event_version)
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
 def nominee_list_create(request, event_id):
-    """List nominees for an event, or add new nominees."""
+    """List nominees for an event, or add new nominees.
+
+    GET accepts ``status`` / ``department`` filters, ``fields`` and the
+    optional ``cursor`` / ``page_size`` pagination params.
+    """
     try:
         event = Event.objects.get(pk=event_id)
     except Event.DoesNotExist:
         return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
 
     if request.method == "GET":
-        nominees = Nominee.objects.filter(event=event)
-        serializer = NomineeSerializer(nominees, many=True)
-        return Response(serializer.data)
+        nominees = Nominee.objects.filter(event=event).select_related(
+            "employee", "feedback"
+        )
+        nominees = filter_nominees(nominees, request.query_params)
+        return _list_response(
+            request,
+            nominees,
+            NomineeSerializer,
+            NomineeCursorPagination(),
+            fast_rows=nominee_list,
+        )
 
     elif request.method == "POST":
         # Support both single nominee and list of nominees
@@ -134,18 +267,22 @@ def nominee_list_create(request, event_id):
         )
         created_nominees = []
         errors = []
+        # Renders the invitation's event part once for every row.
+        campaign = InvitationCampaign(event)
 
         for data in nominees_data:
             data["event"] = event.id
             serializer = NomineeSerializer(data=data)
             if serializer.is_valid():
-                nominee = serializer.save(event=event)
-                # Send invitation email
-                if send_invitation_email(nominee):
-                    created_nominees.append(serializer.data)
-                else:
-                    nominee.delete()  # Rollback if email fails
-                    errors.append({"email": f"Failed to send invitation email to {data.get('email', 'unknown')}"})
+                # The nominee, its counter bump and its invitation commit together.
+                with transaction.atomic():
+                    nominee = serializer.save(event=event)
+                    Event.objects.filter(pk=event.id).adjust_counts(
+                        total_nominees=1, pending_count=1
+                    )
+                    # Queue invitation email for the outbox worker
+                    enqueue(campaign.message(nominee))
+                created_nominees.append(serializer.data)
             else:
                 errors.append(serializer.errors)
 
@@ -161,12 +298,78 @@ def nominee_list_create(request, event_id):
         return Response(created_nominees, status=status.HTTP_201_CREATED)
 
 
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def nominee_bulk_import(request, event_id):
+    """Import a JSON array of nominees in one transaction with a per-row report."""
+    try:
+        event = Event.objects.get(pk=event_id)
+    except Event.DoesNotExist:
+        return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    if not isinstance(request.data, list):
+        return Response(
+            {"error": "Expected a list of nominees."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    with transaction.atomic():
+        results = [
+            result
+            for chunk in import_nominees(event, request.data)
+            for result in chunk
+        ]
+
+    summary = summarize(results)
+    if summary["created"] == len(results):
+        response_status = status.HTTP_201_CREATED
+    elif summary["created"]:
+        response_status = status.HTTP_207_MULTI_STATUS
+    else:
+        response_status = status.HTTP_400_BAD_REQUEST
+    return Response({**summary, "rows": results}, status=response_status)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def nominee_upload(request, event_id):
+    """Queue a CSV/XLSX nominee spreadsheet for background import."""
+    try:
+        event = Event.objects.get(pk=event_id)
+    except Event.DoesNotExist:
+        return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    upload = request.FILES.get("file")
+    if upload is None or not upload.name.lower().endswith(SPREADSHEET_EXTENSIONS):
+        return Response(
+            {"error": "Upload a .csv or .xlsx file in the 'file' field."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    job = ImportJob.objects.create(event=event, file=upload)
+    serializer = ImportJobSerializer(job)
+    return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def import_job_detail(request, pk):
+    """Poll the progress of a nominee spreadsheet import."""
+    try:
+        job = ImportJob.objects.get(pk=pk)
+    except ImportJob.DoesNotExist:
+        return Response({"error": "Import not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    serializer = ImportJobSerializer(job)
+    return Response(serializer.data)
+
+
 @api_view(["GET", "PUT", "DELETE"])
 @permission_classes([IsAuthenticated])
 def nominee_detail(request, pk):
     """Get, update, or delete a specific nominee."""
     try:
-        nominee = Nominee.objects.get(pk=pk)
+        nominee = Nominee.objects.live().select_related("employee").get(pk=pk)
     except Nominee.DoesNotExist:
         return Response({"error": "Nominee not found."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -175,74 +378,103 @@ def nominee_detail(request, pk):
         return Response(serializer.data)
 
     elif request.method == "PUT":
+        old_event_id = nominee.event_id
         serializer = NomineeSerializer(nominee, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            with transaction.atomic():
+                nominee = serializer.save()
+                if nominee.event_id != old_event_id:
+                    # Nominee moved to another event; shift its counts across.
+                    Event.objects.filter(pk=old_event_id).adjust_counts(
+                        **_nominee_counts(nominee, sign=-1)
+                    )
+                    Event.objects.filter(pk=nominee.event_id).adjust_counts(
+                        **_nominee_counts(nominee)
+                    )
+                else:
+                    Event.objects.filter(pk=nominee.event_id).touch()
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     elif request.method == "DELETE":
-        nominee.delete()
+        deltas = _nominee_counts(nominee, sign=-1)
+        with transaction.atomic():
+            nominee.delete()
+            Event.objects.filter(pk=nominee.event_id).adjust_counts(**deltas)
         return Response({"message": "Nominee deleted successfully."}, status=status.HTTP_200_OK)
 
 
 # ─── Accept / Reject (Public links) ──────────────────────────────────
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def nominee_accept(request, pk):
-    """Nominee accepts the invitation (public link from email)."""
-    try:
-        nominee = Nominee.objects.get(pk=pk)
-    except Nominee.DoesNotExist:
-        return Response(
-            {"error": "Nominee not found."}, status=status.HTTP_404_NOT_FOUND
+# Columns needed to answer an invitation link and notify the admin
+RESPONSE_FIELDS = (
+    "status",
+    "event__title",
+    "employee__name",
+    "employee__email",
+    "employee__department",
+)
+
+
+def _apply_response(nominee, new_status):
+    """Record a Pending nominee's answer; returns False if another click won."""
+    with transaction.atomic():
+        # The conditional UPDATE settles double clicks: only one wins.
+        changed = Nominee.objects.filter(pk=nominee.pk).transition(
+            nominee.event_id, "Pending", new_status
         )
+        if changed:
+            # Queue notification to admin, committed with the change
+            enqueue(build_status_notification_to_admin(nominee, new_status))
+            publish_status_change(nominee.event_id, [nominee.pk], "Pending", new_status)
+    return bool(changed)
+
 
-    if nominee.status != "Pending":
+def _response_redirect(nominee, new_status, changed):
+    name = nominee.employee.name
+    if not changed:
         # Redirect to frontend response page with already-responded message
         return HttpResponseRedirect(
-            f"{settings.FRONTEND_URL}/response?status=already&name={nominee.name}"
+            f"{settings.FRONTEND_URL}/response?status=already&name={name}"
         )
 
-    nominee.status = "Accepted"
-    nominee.save()
-
-    # Send notification to admin
-    send_status_notification_to_admin(nominee, "Accepted")
-
     # Redirect to a nice frontend page
     return HttpResponseRedirect(
-        f"{settings.FRONTEND_URL}/response?status=accepted&name={nominee.name}&event={nominee.event.title}"
+        f"{settings.FRONTEND_URL}/response?status={new_status.lower()}&name={name}&event={nominee.event.title}"
     )
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def nominee_reject(request, pk):
-    """Nominee rejects the invitation (public link from email)."""
+def _respond_to_invitation(pk, new_status):
+    """Apply an accept/reject link click and redirect to the frontend page."""
     try:
-        nominee = Nominee.objects.get(pk=pk)
+        nominee = (
+            Nominee.objects.live()
+            .select_related("event", "employee")
+            .only(*RESPONSE_FIELDS)
+            .get(pk=pk)
+        )
     except Nominee.DoesNotExist:
         return Response(
             {"error": "Nominee not found."}, status=status.HTTP_404_NOT_FOUND
         )
 
-    if nominee.status != "Pending":
-        return HttpResponseRedirect(
-            f"{settings.FRONTEND_URL}/response?status=already&name={nominee.name}"
-        )
+    changed = nominee.status == "Pending" and _apply_response(nominee, new_status)
+    return _response_redirect(nominee, new_status, changed)
 
-    nominee.status = "Rejected"
-    nominee.save()
 
-    # Send notification to admin
-    send_status_notification_to_admin(nominee, "Rejected")
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def nominee_accept(request, pk):
+    """Nominee accepts the invitation (public link from email)."""
+    return _respond_to_invitation(pk, "Accepted")
 
-    return HttpResponseRedirect(
-        f"{settings.FRONTEND_URL}/response?status=rejected&name={nominee.name}&event={nominee.event.title}"
-    )
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def nominee_reject(request, pk):
+    """Nominee rejects the invitation (public link from email)."""
+    return _respond_to_invitation(pk, "Rejected")
 
 
 # ─── Attendance ───────────────────────────────────────────────────────
@@ -253,13 +485,22 @@ def nominee_reject(request, pk):
 def mark_attendance(request, pk):
     """Mark an accepted nominee as attended."""
     try:
-        nominee = Nominee.objects.get(pk=pk)
+        nominee = (
+            Nominee.objects.live().select_related("employee", "feedback").get(pk=pk)
+        )
     except Nominee.DoesNotExist:
         return Response(
             {"error": "Nominee not found."}, status=status.HTTP_404_NOT_FOUND
         )
 
-    if nominee.status != "Accepted":
+    changed = nominee.status == "Accepted" and Nominee.objects.filter(pk=pk).transition(
+        nominee.event_id, "Accepted", "Attended"
+    )
+    if not changed:
+        if nominee.status == "Accepted":
+            # Another request changed the status since it was read.
+            current = Nominee.objects.filter(pk=pk).values_list("status", flat=True)
+            nominee.status = current.first() or "changed concurrently"
         return Response(
             {
                 "error": f"Can only mark accepted nominees as attended. Current status: {nominee.status}"
@@ -267,48 +508,111 @@ def mark_attendance(request, pk):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    publish_status_change(nominee.event_id, [pk], "Accepted", "Attended")
     nominee.status = "Attended"
-    nominee.save()
     serializer = NomineeSerializer(nominee)
     return Response(serializer.data)
 
 
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def bulk_mark_attendance(request, event_id):
+    """Mark many accepted nominees of an event as attended in one UPDATE.
+
+    Takes ``nominee_ids`` or ``employee_ids`` as a JSON list, or a
+    badge-scanner CSV in ``file`` with an ``employee_id`` (or ``id``) column.
+    """
+    if not Event.objects.filter(pk=event_id).exists():
+        return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    upload = request.FILES.get("file")
+    if upload is not None:
+        field, values = ids_from_csv(upload, request.data.get("column", "employee_id"))
+    else:
+        keys = [key for key in ID_FIELDS if key in request.data]
+        if len(keys) != 1 or not isinstance(request.data[keys[0]], list):
+            return Response(
+                {"error": "Send a list in exactly one of 'nominee_ids' or 'employee_ids', or a CSV 'file'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        field = ID_FIELDS[keys[0]]
+        values = request.data[keys[0]]
+
+    attended, skipped = mark_attended(event_id, field, values)
+    return Response(
+        {
+            "attended_count": len(attended),
+            "skipped_count": len(skipped),
+            "attended": attended,
+            "skipped": skipped,
+        }
+    )
+
+
 # ─── Send Feedback Emails ────────────────────────────────────────────
 
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def send_feedback_emails(request, event_id):
-    """Send feedback emails to all attended nominees of an event."""
+    """Queue feedback emails to all attended nominees of an event."""
     try:
         event = Event.objects.get(pk=event_id)
     except Event.DoesNotExist:
         return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
 
-    attended_nominees = Nominee.objects.filter(event=event, status="Attended")
+    attended_nominees = Nominee.objects.filter(
+        event=event, status="Attended"
+    ).select_related("employee")
     if not attended_nominees.exists():
         return Response(
             {"error": "No attended nominees found for this event."},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    sent_count = 0
-    for nominee in attended_nominees:
-        if send_feedback_email(nominee):
-            sent_count += 1
+    campaign = FeedbackCampaign(event)
+    queued = enqueue(*(campaign.message(nominee) for nominee in attended_nominees))
 
-    return Response({"message": f"Feedback emails sent to {sent_count} nominee(s)."})
+    return Response({"message": f"Feedback emails queued for {len(queued)} nominee(s)."})
 
 
 # ─── Feedback ─────────────────────────────────────────────────────────
 
 
+def _save_feedback(nominee, data):
+    """Create or update an attended nominee's feedback.
+
+    Returns ``(response_data, status_code)``.
+    """
+    data["nominee"] = nominee.id
+
+    # Check if feedback already exists
+    if hasattr(nominee, "feedback") and nominee.feedback:
+        serializer = FeedbackSerializer(nominee.feedback, data=data, partial=True)
+        if serializer.is_valid():
+            with transaction.atomic():
+                feedback = serializer.save()
+                Event.objects.filter(pk=nominee.event_id).touch()
+                publish_feedback(nominee.event_id, feedback, created=False)
+            return {"message": "Feedback updated successfully."}, status.HTTP_200_OK
+        return serializer.errors, status.HTTP_400_BAD_REQUEST
+
+    serializer = FeedbackSerializer(data=data)
+    if serializer.is_valid():
+        with transaction.atomic():
+            feedback = serializer.save()
+            Event.objects.filter(pk=nominee.event_id).adjust_counts(feedback_count=1)
+            publish_feedback(nominee.event_id, feedback, created=True)
+        return {"message": "Feedback submitted successfully."}, status.HTTP_201_CREATED
+    return serializer.errors, status.HTTP_400_BAD_REQUEST
+
+
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def submit_feedback(request, nominee_id):
     """Submit feedback (public page, no auth required)."""
     try:
-        nominee = Nominee.objects.get(pk=nominee_id)
+        nominee = Nominee.objects.live().get(pk=nominee_id)
     except Nominee.DoesNotExist:
         return Response(
             {"error": "Nominee not found."}, status=status.HTTP_404_NOT_FOUND
@@ -320,27 +624,17 @@ def submit_feedback(request, nominee_id):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # Check if feedback already exists
-    if hasattr(nominee, "feedback") and nominee.feedback:
-        serializer = FeedbackSerializer(nominee.feedback, data=data, partial=True)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(
-                {"message": "Feedback updated successfully."},
-                status=status.HTTP_200_OK,
-            )
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    data, response_status = _save_feedback(nominee, request.data.copy())
+    return Response(data, status=response_status)
 
-    data = request.data.copy()
-    data["nominee"] = nominee.id
-    serializer = FeedbackSerializer(data=data)
-    if serializer.is_valid():
-        serializer.save()
-        return Response(
-            {"message": "Feedback submitted successfully."},
-            status=status.HTTP_201_CREATED,
-        )
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+def _nominee_info(nominee):
+    return {
+        "nominee_name": nominee.employee.name,
+        "event_title": nominee.event.title,
+        "status": nominee.status,
+        "has_feedback": hasattr(nominee, "feedback"),
+    }
 
 
 @api_view(["GET"])
@@ -348,7 +642,11 @@ def submit_feedback(request, nominee_id):
 def get_nominee_info(request, nominee_id):
     """Get nominee and event info for the feedback form (public)."""
     try:
-        nominee = Nominee.objects.select_related("event").get(pk=nominee_id)
+        nominee = (
+            Nominee.objects.live()
+            .select_related("event", "employee")
+            .get(pk=nominee_id)
+        )
     except Nominee.DoesNotExist:
         return Response(
             {"error": "Nominee not found."}, status=status.HTTP_404_NOT_FOUND
@@ -360,16 +658,10 @@ def get_nominee_info(request, nominee_id):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    return Response(
-        {
-            "nominee_name": nominee.name,
-            "event_title": nominee.event.title,
-            "status": nominee.status,
-            "has_feedback": hasattr(nominee, "feedback"),
-        }
-    )
+    return Response(_nominee_info(nominee))
 
 
+@conditional_get(event_version)
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def event_feedback(request, event_id):
@@ -379,59 +671,70 @@ def event_feedback(request, event_id):
     except Event.DoesNotExist:
         return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
 
-    feedbacks = Feedback.objects.filter(nominee__event=event).select_related("nominee")
+    feedbacks = Feedback.objects.filter(nominee__event=event).select_related(
+        "nominee__employee"
+    )
+    if _wants_fast_json(request):
+        return FastJSONResponse(event_feedback_list(feedbacks))
     serializer = FeedbackSerializer(feedbacks, many=True)
 
     # Add nominee name to each feedback
     data = serializer.data
     for item, fb in zip(data, feedbacks):
-        item["nominee_name"] = fb.nominee.name
-        item["nominee_email"] = fb.nominee.email
-        item["nominee_department"] = fb.nominee.department
+        item["nominee_name"] = fb.nominee.employee.name
+        item["nominee_email"] = fb.nominee.employee.email
+        item["nominee_department"] = fb.nominee.employee.department
 
     return Response(data)
 
 
+@conditional_get(event_version)
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def download_feedback_csv(request, event_id):
-    """Download all feedback for an event as CSV."""
+def event_feedback_analytics(request, event_id):
+    """Rating average and distribution, response rate and per-department stats."""
     try:
         event = Event.objects.get(pk=event_id)
     except Event.DoesNotExist:
         return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
 
-    feedbacks = Feedback.objects.filter(nominee__event=event).select_related("nominee")
+    return Response(get_event_analytics(event))
 
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = (
-        f'attachment; filename="{event.title}_feedback.csv"'
-    )
 
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "Nominee Name",
-            "Email",
-            "Department",
-            "Rating",
-            "Comments",
-            "Suggestions",
-            "Submitted At",
-        ]
-    )
+@conditional_get(event_list_version)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def feedback_trend(request):
+    """Response rate and average rating per event over time."""
+    return Response(get_trend(request.query_params))
+
+
+def _csv_download(request, chunks, filename):
+    """Stream CSV chunks as a download, gzipped when the client accepts it."""
+    if "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+        response = StreamingHttpResponse(gzip_csv(chunks), content_type="text/csv")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = StreamingHttpResponse(chunks, content_type="text/csv")
+    patch_vary_headers(response, ["Accept-Encoding"])
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
-    for fb in feedbacks:
-        writer.writerow(
-            [
-                fb.nominee.name,
-                fb.nominee.email,
-                fb.nominee.department,
-                fb.rating,
-                fb.comments,
-                fb.suggestions,
-                fb.submitted_at.strftime("%Y-%m-%d %H:%M:%S"),
-            ]
-        )
 
-    return response
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def download_feedback_csv(request, event_id):
+    """Stream all feedback for an event as CSV."""
+    try:
+        event = Event.objects.get(pk=event_id)
+    except Event.DoesNotExist:
+        return Response({"error": "Event not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    return _csv_download(request, feedback_csv(event), f"{event.title}_feedback.csv")
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def download_all_feedback_csv(request):
+    """Stream feedback for every event as one CSV with an Event column."""
+    return _csv_download(request, feedback_csv(), "all_feedback.csv")
@@ -1,5 +1,16 @@
 import os
+
+from django.conf import settings
 from django.core.asgi import get_asgi_application
+from django.core.exceptions import ImproperlyConfigured
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 application = get_asgi_application()
+
+# Persistent connections leak under ASGI (see config/settings_production.py).
+for alias, database in settings.DATABASES.items():
+    if database.get("CONN_MAX_AGE", 0) != 0:
+        raise ImproperlyConfigured(
+            f"DATABASES[{alias!r}]['CONN_MAX_AGE'] must be 0 under ASGI; "
+            "persistent connections are not reused there (Django ticket #33497)."
+        )
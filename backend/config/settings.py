@@ -25,6 +25,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "api.metrics.RequestMetricsMiddleware",  # no-op unless REQUEST_METRICS_ENABLED
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -88,6 +89,9 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+MEDIA_URL = "media/"
+MEDIA_ROOT = BASE_DIR / "media"
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
@@ -115,6 +119,31 @@ CSRF_TRUSTED_ORIGINS = [
     "http://127.0.0.1:3000",
 ]
 
+# Local memory by default; point BACKEND/LOCATION at Redis in production,
+# e.g. "django.core.cache.backends.redis.RedisCache" / "redis://127.0.0.1:6379".
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+ASYNC_PUBLIC_VIEWS = False          # Serve public links from api/async_views.py (ASGI)
+
+DASHBOARD_SUMMARY_TTL = 15          # Seconds the dashboard summary is cached
+FEEDBACK_ANALYTICS_TTL = 300        # Seconds feedback analytics are cached
+DEPARTMENT_ROLLUP_TTL = 300         # Seconds per-department nomination rollups are cached
+
+EVENT_INLINE_DELETE_LIMIT = 1000    # Events with more nominees are deleted in the background
+EVENT_PURGE_BATCH_SIZE = 500        # Nominees (and their feedback) removed per transaction
+
+LIVE_UPDATES_BROKER = "api.live.InProcessBroker"  # api.live.RedisBroker to share across processes
+LIVE_UPDATES_REDIS_URL = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
+LIVE_UPDATES_HEARTBEAT = 15.0       # Seconds between keep-alive comments on idle streams
+LIVE_UPDATES_MAX_AGE = 300          # Seconds before a stream ends and EventSource reconnects
+
+REQUEST_METRICS_ENABLED = False     # Per-view latency/SQL metrics on /metrics
+METRICS_TOKEN = ""                  # /metrics needs "Authorization: Bearer <token>"; unset denies all
+SLOW_REQUEST_THRESHOLD = 1.0        # Seconds; slower requests are logged with their top SQL
+
 SESSION_ENGINE = "django.contrib.sessions.backends.db"
 SESSION_COOKIE_AGE = 86400
 SESSION_COOKIE_SAMESITE = "Lax"
@@ -131,6 +160,8 @@ EMAIL_HOST_USER = "praveen.n7050@gmail.com"
 EMAIL_HOST_PASSWORD = "skjj vaaf mtlv xoiv"
 DEFAULT_FROM_EMAIL = "praveen.n7050@gmail.com"
 ADMIN_EMAIL = "praveen.n7050@gmail.com"
+EMAIL_BATCH_SIZE = 100      # Messages sent per SMTP connection / outbox batch
+EMAIL_BATCH_DELAY = 1.0     # Seconds between batches, across all outbox threads
 
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5175")
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
\ No newline at end of file
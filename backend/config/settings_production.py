@@ -0,0 +1,46 @@
+"""Production profile: the base settings plus connection and session reuse.
+
+Select it with ``DJANGO_SETTINGS_MODULE=config.settings_production`` (or
+``--settings=config.settings_production``). ``REDIS_URL`` points the
+caches at a shared Redis server, e.g. ``redis://127.0.0.1:6379/0``, and
+``DB_CONN_MAX_AGE`` turns on persistent connections for WSGI servers.
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+from .settings import DATABASES
+
+DEBUG = False
+
+# Under WSGI (e.g. gunicorn), DB_CONN_MAX_AGE=600 keeps each worker's
+# MySQL connection open between requests; it is checked before reuse
+# (Django pings once per request). Leave it at 0 under ASGI: each request's
+# sync code runs in a new thread there, so persistent connections are never
+# reused and pile up until max_connections (Django ticket #33497).
+# config/asgi.py refuses to start with them.
+DATABASES["default"]["CONN_MAX_AGE"] = int(os.environ.get("DB_CONN_MAX_AGE", "0"))
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+# /metrics refuses every scrape until a token is configured.
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+REDIS_URL = os.environ.get("REDIS_URL")
+if REDIS_URL:
+    # Sessions are read from the shared cache and only fall back to the
+    # session table on a miss; writes still go to both, so nothing is lost
+    # on a cache restart. Without Redis they stay in the session table: a
+    # per-process cache would let another worker keep serving a session
+    # this one logged out.
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+    SESSION_CACHE_ALIAS = "sessions"
+    # Live updates published by any worker reach streams on every worker.
+    LIVE_UPDATES_BROKER = "api.live.RedisBroker"
+    CACHES = {
+        alias: {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": alias,
+        }
+        for alias in ("default", "sessions")
+    }
@@ -3,43 +3,29 @@ import { Link } from 'react-router-dom';
 import API from '../api/axios';
 
 function Dashboard() {
-  const [events, setEvents] = useState([]);
+  const [summary, setSummary] = useState(null);
   const [selectedEvent, setSelectedEvent] = useState(null);
-  const [nominees, setNominees] = useState([]);
   const [loading, setLoading] = useState(true);
-  const [nomineesLoading, setNomineesLoading] = useState(false);
 
   useEffect(() => {
-    fetchEvents();
+    fetchSummary();
   }, []);
 
-  const fetchEvents = async () => {
+  // One request carries every event's counts, so switching tabs is local.
+  const fetchSummary = async () => {
     try {
-      const res = await API.get('/events/');
-      setEvents(res.data);
-      if (res.data.length > 0) {
-        selectEvent(res.data[0]);
+      const res = await API.get('/dashboard/summary/');
+      setSummary(res.data);
+      if (res.data.events.length > 0) {
+        setSelectedEvent(res.data.events[0]);
       }
     } catch (err) {
-      console.error('Error fetching events:', err);
+      console.error('Error fetching dashboard summary:', err);
     } finally {
       setLoading(false);
     }
   };
 
-  const selectEvent = async (event) => {
-    setSelectedEvent(event);
-    setNomineesLoading(true);
-    try {
-      const res = await API.get(`/events/${event.id}/nominees/`);
-      setNominees(res.data);
-    } catch (err) {
-      console.error('Error fetching nominees:', err);
-    } finally {
-      setNomineesLoading(false);
-    }
-  };
-
   const getStatusBadge = (status) => {
     const cls = status.toLowerCase();
     return <span className={`badge-status badge-${cls}`}>{status}</span>;
@@ -51,10 +37,20 @@ function Dashboard() {
     );
   }
 
+  const events = summary?.events ?? [];
+  const totals = summary?.totals;
+
   return (
     <div className="container content-area">
       <div className="page-header">
-        <h4><i className="bi bi-grid-1x2-fill me-2"></i>Dashboard</h4>
+        <div>
+          <h4><i className="bi bi-grid-1x2-fill me-2"></i>Dashboard</h4>
+          {totals && (
+            <small className="text-muted">
+              {totals.events} events · {totals.total_nominees} nominees · {totals.feedback_count} feedback responses
+            </small>
+          )}
+        </div>
         <Link to="/events/new" className="btn btn-primary">
           <i className="bi bi-plus-lg me-1"></i> New Event
         </Link>
@@ -77,7 +73,7 @@ function Dashboard() {
                 <button
                   key={event.id}
                   className={`btn btn-sm ${selectedEvent?.id === event.id ? 'btn-primary' : 'btn-outline-secondary'}`}
-                  onClick={() => selectEvent(event)}
+                  onClick={() => setSelectedEvent(event)}
                 >
                   {event.title}
                 </button>
@@ -154,60 +150,69 @@ function Dashboard() {
                       <div className="fw-semibold">{selectedEvent.venue}</div>
                     </div>
                   </div>
-                  {selectedEvent.description && (
-                    <div className="mt-2">
-                      <small className="text-muted">Description</small>
-                      <div>{selectedEvent.description}</div>
-                    </div>
-                  )}
                 </div>
               </div>
-              <div className="card-custom">
-                <div className="card-header">
-                  <i className="bi bi-people me-2"></i>Nominees ({nominees.length})
+              <div className="row g-3">
+                <div className="col-lg-8">
+                  <div className="card-custom">
+                    <div className="card-header">
+                      <i className="bi bi-clock-history me-2"></i>Recent Responses
+                    </div>
+                    <div className="card-body p-0">
+                      {summary.recent_responses.length === 0 ? (
+                        <div className="empty-state py-4">
+                          <i className="bi bi-inbox" style={{ fontSize: '2rem' }}></i>
+                          <p className="mt-2 mb-0">No responses yet</p>
+                        </div>
+                      ) : (
+                        <div className="table-responsive">
+                          <table className="table table-hover mb-0">
+                            <thead>
+                              <tr>
+                                <th>Name</th>
+                                <th>Department</th>
+                                <th>Event</th>
+                                <th>Status</th>
+                                <th>When</th>
+                              </tr>
+                            </thead>
+                            <tbody>
+                              {summary.recent_responses.map((r) => (
+                                <tr key={r.id}>
+                                  <td className="fw-semibold">{r.name}</td>
+                                  <td>{r.department}</td>
+                                  <td>{r.event_title}</td>
+                                  <td>{getStatusBadge(r.status)}</td>
+                                  <td>{new Date(r.status_changed_at).toLocaleString()}</td>
+                                </tr>
+                              ))}
+                            </tbody>
+                          </table>
+                        </div>
+                      )}
+                    </div>
+                  </div>
                 </div>
-                <div className="card-body p-0">
-                  {nomineesLoading ? (
-                    <div className="spinner-wrapper"><div className="spinner-border spinner-border-sm text-primary"></div></div>
-                  ) : nominees.length === 0 ? (
-                    <div className="empty-state py-4">
-                      <i className="bi bi-person-x" style={{ fontSize: '2rem' }}></i>
-                      <p className="mt-2 mb-0">No nominees yet</p>
+                <div className="col-lg-4">
+                  <div className="card-custom">
+                    <div className="card-header">
+                      <i className="bi bi-calendar-event me-2"></i>Upcoming Events
                     </div>
-                  ) : (
-                    <div className="table-responsive">
-                      <table className="table table-hover mb-0">
-                        <thead>
-                          <tr>
-                            <th>Name</th>
-                            <th>Email</th>
-                            <th>Department</th>
-                            <th>Status</th>
-                            <th>Feedback</th>
-                          </tr>
-                        </thead>
-                        <tbody>
-                          {nominees.map((n) => (
-                            <tr key={n.id}>
-                              <td className="fw-semibold">{n.name}</td>
-                              <td>{n.email}</td>
-                              <td>{n.department}</td>
-                              <td>{getStatusBadge(n.status)}</td>
-                              <td>
-                                {n.feedback ? (
-                                  <span title={`Comments: ${n.feedback.comments}`}>
-                                    {'⭐'.repeat(n.feedback.rating)}
-                                  </span>
-                                ) : (
-                                  <span className="text-muted">—</span>
-                                )}
-                              </td>
-                            </tr>
+                    <div className="card-body">
+                      {summary.upcoming.length === 0 ? (
+                        <p className="text-muted mb-0">Nothing scheduled</p>
+                      ) : (
+                        <ul className="list-unstyled mb-0">
+                          {summary.upcoming.map((event) => (
+                            <li key={event.id} className="mb-2">
+                              <Link to={`/events/${event.id}/nominees`} className="fw-semibold">{event.title}</Link>
+                              <div><small className="text-muted">{event.date} · {event.time} · {event.venue}</small></div>
+                            </li>
                           ))}
-                        </tbody>
-                      </table>
+                        </ul>
+                      )}
                     </div>
-                  )}
+                  </div>
                 </div>
               </div>
             </>